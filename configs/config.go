@@ -43,11 +43,12 @@ type LogConfig struct {
 
 // RedisConfig Redis配置
 type RedisConfig struct {
-	Addr     string        `mapstructure:"addr"`
-	Password string        `mapstructure:"password"`
-	DB       int           `mapstructure:"db"`
-	PoolSize int           `mapstructure:"pool_size"`
-	Timeout  time.Duration `mapstructure:"timeout"`
+	Addr         string        `mapstructure:"addr"`
+	Password     string        `mapstructure:"password"`
+	DB           int           `mapstructure:"db"`
+	PoolSize     int           `mapstructure:"pool_size"`      // 连接池大小，小于等于0时按CPU数自动计算
+	MinIdleConns int           `mapstructure:"min_idle_conns"` // 最小空闲连接数
+	Timeout      time.Duration `mapstructure:"timeout"`
 }
 
 // WebSocketConfig WebSocket客户端配置
@@ -82,7 +83,7 @@ type ProxyConfig struct {
 type PumpPortalOptions struct {
 	ProxyURL        string        `mapstructure:"proxy_url"`         // 代理服务器URL
 	ReconnectDelay  time.Duration `mapstructure:"reconnect_delay"`   // 重连延迟
-	MaxRetryAttempt int           `mapstructure:"max_retry_attempt"` // 最大重试次数
+	MaxRetryAttempt int           `mapstructure:"max_retry_attempt"` // 连续重连失败告警阈值，达到后仍继续重连
 }
 
 // 全局配置实例
@@ -177,7 +178,8 @@ func setDefaultConfig(v *viper.Viper) {
 	v.SetDefault("redis.addr", "localhost:6379")
 	v.SetDefault("redis.password", "")
 	v.SetDefault("redis.db", 0)
-	v.SetDefault("redis.pool_size", 10)
+	v.SetDefault("redis.pool_size", 0)
+	v.SetDefault("redis.min_idle_conns", 0)
 	v.SetDefault("redis.timeout", 5*time.Second)
 
 	// 解析器配置
@@ -240,7 +242,8 @@ redis:
   addr: localhost:6379  # Redis服务器地址
   password: ""          # Redis密码
   db: 0                 # 使用的数据库编号
-  pool_size: 10         # 连接池大小
+  pool_size: 0          # 连接池大小，0表示按CPU数自动计算
+  min_idle_conns: 0     # 最小空闲连接数
   timeout: 5s           # 连接超时时间
   
 # WebSocket客户端配置
@@ -12,38 +12,47 @@ import (
 	"github.com/life2you/datas-go/models/resp"
 	"github.com/life2you/datas-go/rpc"
 	"github.com/life2you/datas-go/storage"
+	"github.com/life2you/datas-go/utils"
 	"go.uber.org/zap"
 )
 
+const (
+	// 投票程序ID
+	voteProgramID = "Vote111111111111111111111111111111111111111"
+	// 获取区块的最大重试次数
+	maxBlockRetries = 5
+	// 获取区块重试的基础等待时间
+	blockRetryBaseDelay = 500 * time.Millisecond
+	// 获取区块重试的最大等待时间
+	blockRetryMaxDelay = 8 * time.Second
+	// 每轮扫描处理的区块数量
+	scanBlockBatchSize = 3
+)
+
 // 轮训扫描区块队列
-func StartScanBlockQueue() {
+// 参数:
+//   - parent: 父上下文，取消后中止进行中的区块获取
+func StartScanBlockQueue(parent context.Context) {
 	// 创建有超时控制的上下文
-	ctx, cancel := context.WithTimeout(context.Background(), 120*time.Second)
+	ctx, cancel := context.WithTimeout(parent, 120*time.Second)
 	defer cancel()
 
-	slotList := make([]uint64, 0)
-	for {
-		// 获取最小区块
-		slotAny, _, ok := storage.GlobalBlockQueue.Pop()
-		if !ok {
-			break
-		}
-		slot := slotAny.(uint64)
-		slotList = append(slotList, slot)
-		if len(slotList) >= 3 {
-			break
-		}
+	// 一次加锁取出最小的若干个区块
+	slotValues := storage.GlobalBlockQueue.PopBatch(scanBlockBatchSize)
+	slotList := make([]uint64, 0, len(slotValues))
+	for _, slotAny := range slotValues {
+		slotList = append(slotList, slotAny.(uint64))
 	}
 
 	if len(slotList) == 0 {
-		logger.Info("没有区块需要处理")
+		logger.Debug("没有区块需要处理")
 		return
 	}
 
+	// 批次内的区块同时获取，总耗时取决于最慢的区块而不是各区块耗时之和
 	wg := sync.WaitGroup{}
 	for _, slot := range slotList {
 		wg.Add(1)
-		time.Sleep(200 * time.Millisecond)
 		go func(slot uint64) {
 			defer wg.Done()
 			handleBlock(ctx, slot)
@@ -53,68 +62,53 @@ func StartScanBlockQueue() {
 }
 
 func handleBlock(ctx context.Context, slot uint64) {
-	logger.Info("开始处理区块", zap.Uint64("slot", slot))
-	// 如果报错，则重试
+	logger.Debug("开始处理区块", zap.Uint64("slot", slot))
+	// 如果报错，则按指数退避重试
 	var blockResp json.RawMessage
-	i := 0
-	for {
-		if i > 5 {
+	for attempt := 0; ; attempt++ {
+		if attempt > maxBlockRetries {
 			logger.Error("重试5次获取区块数据失败", zap.Uint64("slot", slot))
 			return
 		}
+		if attempt > 0 {
+			if err := utils.Sleep(ctx, utils.Backoff(attempt-1, blockRetryBaseDelay, blockRetryMaxDelay)); err != nil {
+				logger.Error("等待重试获取区块时上下文已结束", zap.Uint64("slot", slot), zap.Error(err))
+				return
+			}
+		}
+
 		innerBlockResp, err := rpc.GlobalHeliusClient.GetBlock(ctx, slot, nil)
 		if err != nil {
-			i++
 			logger.Error("获取区块数据失败", zap.Uint64("slot", slot), zap.Error(err))
-			time.Sleep(2 * time.Second)
 			continue
 		}
-		if innerBlockResp == nil {
-			i++
+		if len(innerBlockResp) == 0 {
 			logger.Info("获取区块失败", zap.Uint64("slot", slot))
-			time.Sleep(2 * time.Second)
 			continue
 		}
-		if innerBlockResp != nil && len(innerBlockResp) > 0 {
-			blockResp = innerBlockResp
-			break
-		}
-
-		i++
+		blockResp = innerBlockResp
+		break
 	}
-	// 解析区块
-	var blockData resp.BlockResp
+	// 解析区块，只解码筛选签名所需的字段
+	var blockData resp.BlockSignaturesResp
 	err := json.Unmarshal(blockResp, &blockData)
 	if err != nil {
 		logger.Error("解析区块数据失败", zap.Uint64("slot", slot), zap.Error(err))
 		return
 	}
 
-	logger.Info("获取区块成功", zap.Uint64("slot", slot))
+	logger.Debug("获取区块成功", zap.Uint64("slot", slot))
 
-	// 收集签名
-	trans := make([]resp.Transactions, 0)
-	for _, transaction := range blockData.Transactions {
-		vote := false
-		if transaction.Meta.LogMessages != nil && len(transaction.Meta.LogMessages) > 0 {
-			for _, logMessage := range transaction.Meta.LogMessages {
-				if strings.Contains(logMessage, "Vote111111111111111111111111111111111111111") {
-					vote = true
-					break
-				}
-			}
-		}
-		if vote {
+	// 收集签名：单次遍历完成过滤与收集，避免中间切片
+	signatures := make([]string, 0, len(blockData.Transactions))
+	for i := range blockData.Transactions {
+		transaction := &blockData.Transactions[i]
+		if isVoteTransaction(transaction.Meta.LogMessages) {
 			continue
 		}
-		if transaction.Meta.Status.Err.InstructionError != nil && len(transaction.Meta.Status.Err.InstructionError) > 0 {
+		if instructionErr := transaction.Meta.Status.Err.InstructionError; len(instructionErr) > 0 && string(instructionErr) != "null" {
 			continue
 		}
-		trans = append(trans, transaction)
-	}
-
-	signatures := make([]string, 0)
-	for _, transaction := range trans {
 		signatures = append(signatures, transaction.Transaction.Signatures...)
 	}
 
@@ -131,9 +125,19 @@ func handleBlock(ctx context.Context, slot uint64) {
 		storage.GlobalTransactionQueue.Push(transactionQueueModel, int64(slot))
 		logger.Info("交易签名已推送到区块队列", zap.Int("交易数", len(signatures)), zap.Uint64("slot", slot))
 	} else {
-		logger.Info("没有有效交易需要解析", zap.Uint64("slot", slot))
+		logger.Debug("没有有效交易需要解析", zap.Uint64("slot", slot))
 	}
 
-	logger.Info("区块处理完成", zap.Uint64("slot", slot))
+	logger.Debug("区块处理完成", zap.Uint64("slot", slot))
 
 }
+
+// isVoteTransaction 根据日志判断是否为投票交易
+func isVoteTransaction(logMessages []string) bool {
+	for _, logMessage := range logMessages {
+		if strings.Contains(logMessage, voteProgramID) {
+			return true
+		}
+	}
+	return false
+}
@@ -6,6 +6,9 @@ import (
 	"github.com/shopspring/decimal"
 )
 
+// SOL有9位小数
+const solDecimals = 9
+
 // ParseSwapTransaction 解析 Swap 交易，返回人类可读格式
 // 例如：地址A 1SOL 购买 100代币1 或 地址A 100代币1 卖出 1SOL
 func ParseSwapTransaction(tx *resp.ParsedTransaction) string {
@@ -31,9 +34,10 @@ func ParseSwapTransaction(tx *resp.ParsedTransaction) string {
 
 		// 找出代币输出
 		if len(swap.TokenOutputs) > 0 {
-			tokenMint = swap.TokenOutputs[0].Mint
-			tokenAmount = swap.TokenOutputs[0].RawTokenAmount.TokenAmount
-			tokenDecimals = swap.TokenOutputs[0].RawTokenAmount.Decimals
+			output := &swap.TokenOutputs[0]
+			tokenMint = output.Mint
+			tokenAmount = output.RawTokenAmount.TokenAmount
+			tokenDecimals = output.RawTokenAmount.Decimals
 		}
 	} else if swap.NativeOutput != nil {
 		// 检查是否有SOL输出（买入SOL）
@@ -43,24 +47,22 @@ func ParseSwapTransaction(tx *resp.ParsedTransaction) string {
 
 		// 找出代币输入
 		if len(swap.TokenInputs) > 0 {
-			tokenMint = swap.TokenInputs[0].Mint
-			tokenAmount = swap.TokenInputs[0].RawTokenAmount.TokenAmount
-			tokenDecimals = swap.TokenInputs[0].RawTokenAmount.Decimals
+			input := &swap.TokenInputs[0]
+			tokenMint = input.Mint
+			tokenAmount = input.RawTokenAmount.TokenAmount
+			tokenDecimals = input.RawTokenAmount.Decimals
 		}
 	} else if len(swap.TokenInputs) > 0 && len(swap.TokenOutputs) > 0 {
 		// 如果只有代币之间的交换
-		account = swap.TokenInputs[0].UserAccount
-		tokenMint = swap.TokenInputs[0].Mint
-		tokenAmount = swap.TokenInputs[0].RawTokenAmount.TokenAmount
-		tokenDecimals = swap.TokenInputs[0].RawTokenAmount.Decimals
+		input, output := &swap.TokenInputs[0], &swap.TokenOutputs[0]
 
 		// 这里是代币间交换，可以扩展解析
 		return fmt.Sprintf("地址%s 用 %s个%s 交换了 %s个%s",
-			formatShortAddress(account),
-			formatTokenAmount(tokenAmount, tokenDecimals),
-			getTokenSymbol(tokenMint),
-			formatTokenAmount(swap.TokenOutputs[0].RawTokenAmount.TokenAmount, swap.TokenOutputs[0].RawTokenAmount.Decimals),
-			getTokenSymbol(swap.TokenOutputs[0].Mint))
+			formatShortAddress(input.UserAccount),
+			formatTokenAmount(input.RawTokenAmount.TokenAmount, input.RawTokenAmount.Decimals),
+			getTokenSymbol(input.Mint),
+			formatTokenAmount(output.RawTokenAmount.TokenAmount, output.RawTokenAmount.Decimals),
+			getTokenSymbol(output.Mint))
 	}
 
 	// 转换数值并格式化输出
@@ -78,14 +80,14 @@ func ParseSwapTransaction(tx *resp.ParsedTransaction) string {
 
 // formatSolAmount 格式化SOL金额（转换为小数）
 func formatSolAmount(amount string) string {
-	value, _ := decimal.NewFromString(amount)
-	return value.Div(decimal.New(1, 9)).String() // SOL有9位小数
+	return formatTokenAmount(amount, solDecimals)
 }
 
 // formatTokenAmount 格式化代币金额
+// 按精度移动小数点，结果精确且不需要构造除数做除法
 func formatTokenAmount(amount string, decimals int) string {
 	value, _ := decimal.NewFromString(amount)
-	return value.Div(decimal.New(1, int32(decimals))).String()
+	return value.Shift(-int32(decimals)).String()
 }
 
 // getTokenSymbol 获取代币符号（需要实现或集成代币元数据服务）
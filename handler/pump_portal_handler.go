@@ -6,6 +6,7 @@ import (
 	"github.com/life2you/datas-go/logger"
 	"github.com/life2you/datas-go/models/resp"
 	"go.uber.org/zap"
+	"go.uber.org/zap/zapcore"
 )
 
 func PumpPortalHandler(message json.RawMessage) {
@@ -13,7 +14,7 @@ func PumpPortalHandler(message json.RawMessage) {
 	var msg resp.ClassifyType
 	err := json.Unmarshal(message, &msg)
 	if err != nil {
-		logger.Error("PumpPortalHandler", zap.String("error", err.Error()))
+		logger.Error("PumpPortalHandler", zap.Error(err))
 		return
 	}
 	if msg.TxType == "" {
@@ -25,6 +26,9 @@ func PumpPortalHandler(message json.RawMessage) {
 	case resp.Migrate:
 
 	default:
-		logger.Info(string(msg.TxType), zap.String("message", string(message)))
+		// 交易消息量很大，未启用 Info 级别时跳过字段构造；ByteString 直接引用原始字节，避免复制成字符串
+		if logger.Enabled(zapcore.InfoLevel) {
+			logger.Info(string(msg.TxType), zap.ByteString("message", message))
+		}
 	}
 }
@@ -13,12 +13,18 @@ import (
 	"github.com/life2you/datas-go/rpc"
 	"github.com/life2you/datas-go/storage"
 	"go.uber.org/zap"
+	"go.uber.org/zap/zapcore"
 )
 
+// 每个API客户端同时进行的解析请求数上限
+const maxInFlightPerClient = 2
+
 // 处理队列中的交易签名
-func StartProcessTransactionQueue() {
+// 参数:
+//   - parent: 父上下文，取消后不再等待队列并中止进行中的解析请求
+func StartProcessTransactionQueue(parent context.Context) {
 	// 创建有超时控制的上下文
-	ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
+	ctx, cancel := context.WithTimeout(parent, 60*time.Second)
 	defer cancel()
 	// 获取API客户端数量
 	clientCount := rpc.GetEnhancedApiClientCount()
@@ -29,19 +35,32 @@ func StartProcessTransactionQueue() {
 	// transactionItem, err := storage.GlobalRedisClient.LPopTransactionQueue(ctx)
 	transactionItemAny, _, ok := storage.GlobalTransactionQueue.Pop()
 	if !ok {
-		time.Sleep(1000 * time.Millisecond)
+		// 队列为空时等待入队通知，新交易到达后立即处理
+		select {
+		case <-storage.GlobalTransactionQueue.Ready():
+		case <-ctx.Done():
+		}
 		return
 	}
 	transactionItem := transactionItemAny.(models.TransactionQueueModel)
-	signatures := slices.Chunk(transactionItem.Signatures, 50)
+	// 按接口允许的上限分批，减少请求次数
+	signatures := slices.Chunk(transactionItem.Signatures, rpc.MaxParseTransactionsBatch)
+	// 所有批次同时发起，每个API客户端各用一个信号量限制同时进行的请求数，不再逐个间隔启动
+	// Helius 按API密钥限流，因此上限按客户端而不是全局计算
+	sems := make([]chan struct{}, clientCount)
+	for i := range sems {
+		sems[i] = make(chan struct{}, maxInFlightPerClient)
+	}
 	var wg sync.WaitGroup
 	var i = 0
 	for signature := range signatures {
 		clientIndex := i % clientCount
-		time.Sleep(200 * time.Millisecond)
 		wg.Add(1)
 		go func(clientIndex int, signature []string) {
 			defer wg.Done()
+			sem := sems[clientIndex]
+			sem <- struct{}{}
+			defer func() { <-sem }()
 			processTransactionBatch(ctx, clientIndex, transactionItem.Slot, signature...)
 		}(clientIndex, signature)
 		i++
@@ -62,7 +81,7 @@ func processTransactionBatch(ctx context.Context, clientIndex int, blockSlot uin
 	}
 
 	// 创建批次专用上下文
-	batchCtx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
+	batchCtx, cancel := context.WithTimeout(ctx, 60*time.Second)
 	defer cancel()
 
 	// 使用指定客户端解析交易
@@ -82,8 +101,13 @@ func processTransactionBatch(ctx context.Context, clientIndex int, blockSlot uin
 		return
 	}
 
-	// 解析交易响应
-	var parsedTransactions []resp.ParsedTransaction
+	// 完整交易内容仅在调试级别输出
+	if logger.Enabled(zapcore.DebugLevel) {
+		logger.Debug("解析交易", zap.Uint64("区块", blockSlot), zap.ByteString("transactions", transactionResp))
+	}
+
+	// 解析交易响应，只解码入库所需的字段
+	var parsedTransactions []resp.ParsedTransactionSummary
 	if err := json.Unmarshal(transactionResp, &parsedTransactions); err != nil {
 		logger.Error("解析交易数据失败",
 			zap.Int("clientIndex", clientIndex),
@@ -92,23 +116,44 @@ func processTransactionBatch(ctx context.Context, clientIndex int, blockSlot uin
 		return
 	}
 
-	// 处理每个交易
-	for _, transaction := range parsedTransactions {
+	// 处理每个交易，待写入的哈希字段先收集起来，最后一次性提交
+	entries := make([]storage.HashEntry, 0, 2*len(parsedTransactions))
+	// 每个来源只保留本批次内最新一笔交易的类型，按 Slot/Timestamp 判断先后
+	// 仅保证批次内的先后：多个批次并发写入时，较早的交易仍可能覆盖其他批次写入的较新类型
+	latestBySource := make(map[string]*resp.ParsedTransactionSummary)
+	for i := range parsedTransactions {
+		transaction := &parsedTransactions[i]
 		if transaction.TransactionError != nil &&
 			transaction.TransactionError.InstructionError != nil &&
 			len(transaction.TransactionError.InstructionError) > 0 {
 			continue
 		}
-		if slices.Contains(resp.NeedToParseTransactionType, transaction.Type) {
-			logger.Info("解析交易", zap.Any("transaction", transaction))
-			// 存储交易数据
-			if err := storage.GlobalRedisClient.StoreHash(ctx, transaction.Source, transaction.Source, string(transaction.Type), 0); err != nil {
-				logger.Error("存储交易哈希失败1", zap.Error(err))
-			}
-			err := storage.GlobalRedisClient.StoreHash(ctx, transaction.Source+"_"+string(transaction.Type), transaction.Signature, string(transaction.Type), 0)
-			if err != nil {
-				logger.Error("存储交易哈希失败2", zap.Error(err))
+		if transaction.Type.NeedToParse() {
+			if latest, ok := latestBySource[transaction.Source]; !ok || !isNewerTransaction(latest, transaction) {
+				latestBySource[transaction.Source] = transaction
 			}
+			entries = append(entries, storage.HashEntry{
+				Key:   transaction.Source + "_" + string(transaction.Type),
+				Field: transaction.Signature,
+				Value: string(transaction.Type),
+			})
 		}
 	}
+	for source, transaction := range latestBySource {
+		entries = append(entries, storage.HashEntry{Key: source, Field: source, Value: string(transaction.Type)})
+	}
+
+	// 存储交易数据，由后台写入器与其他批次合并后写入
+	if err := storage.GlobalHashWriter.Write(entries...); err != nil {
+		logger.Error("写入交易数据失败", zap.Uint64("区块", blockSlot), zap.Error(err))
+	}
+}
+
+// isNewerTransaction 判断同一批次内 a 是否比 b 更新
+// 先比较 Slot，再比较 Timestamp；两者都相同时视为不更新，由后出现的交易覆盖
+func isNewerTransaction(a, b *resp.ParsedTransactionSummary) bool {
+	if a.Slot != b.Slot {
+		return a.Slot > b.Slot
+	}
+	return a.Timestamp > b.Timestamp
 }
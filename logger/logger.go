@@ -129,6 +129,12 @@ func parseLogLevel(levelStr string) zapcore.Level {
 	}
 }
 
+// Enabled 判断指定级别的日志是否会被输出
+// 用于在构造开销较大的日志字段前提前判断，未启用时跳过字段构造
+func Enabled(level zapcore.Level) bool {
+	return Logger.Core().Enabled(level)
+}
+
 // Debug 输出调试日志
 func Debug(msg string, fields ...zap.Field) {
 	Logger.Debug(msg, fields...)
@@ -1,11 +1,11 @@
 package main
 
 import (
+	"context"
 	"github.com/life2you/datas-go/handler"
 	"os"
 	"os/signal"
 	"syscall"
-	"time"
 
 	"go.uber.org/zap"
 
@@ -24,8 +24,13 @@ func main() {
 	// 2. 初始化日志
 	logger.Init(&configs.GlobalConfig.Log)
 
+	// 根上下文，收到退出信号时取消，各后台服务据此停止
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+	defer stop()
+
 	// 3. 初始化redis
 	storage.NewRedisClient(&configs.GlobalConfig.Redis)
+	storage.InitHashWriter()
 
 	// 4. 定义RPC回调函数
 	rpcCallBack := func() {
@@ -45,33 +50,42 @@ func main() {
 		configs.GlobalConfig.HeliusEnhancedAPI.ProxyURL = configs.GlobalConfig.Proxy.URL
 		configs.GlobalConfig.PumpPortal.ProxyURL = configs.GlobalConfig.Proxy.URL
 	}
-	rpc.NewPumpPortalClient(&configs.GlobalConfig.PumpPortal, handler.PumpPortalHandler)
-	service.StartPumpPortalService()
+	pumpPortalClient := rpc.NewPumpPortalClient(&configs.GlobalConfig.PumpPortal, handler.PumpPortalHandler)
+	service.StartPumpPortalService(pumpPortalClient)
 	//initClient()
-	// 7. 启动服务，不需要阻塞
-	// initStartService()
 
 	// 8. 在主协程中打印状态信息
 	logger.Info("程序已启动，正在等待区块数据...")
 
-	// 9. 阻止程序退出
-	// 添加信号处理代码
-	c := make(chan os.Signal, 1)
-	signal.Notify(c, os.Interrupt, syscall.SIGTERM)
-	go func() {
-		<-c
-		logger.Info("接收到退出信号，程序即将关闭...")
-		// 执行清理操作
-		if rpc.GlobalWebSocketClient != nil {
-			rpc.GlobalWebSocketClient.Close()
-		}
-		if storage.GlobalRedisClient != nil {
-			storage.GlobalRedisClient.Close()
-		}
-		os.Exit(0)
-	}()
-
-	select {}
+	// 9. 阻止程序退出，直到收到退出信号
+	<-ctx.Done()
+	// 恢复默认信号处理，关闭过程卡住时再次发送信号可直接结束进程
+	stop()
+
+	logger.Info("接收到退出信号，程序即将关闭...")
+	shutdown()
+}
+
+// shutdown 按依赖顺序释放资源：先停止数据来源并等待队列处理协程退出，再写入缓冲数据，最后关闭Redis并刷新日志
+// 调用前根上下文必须已取消
+func shutdown() {
+	if rpc.GlobalPumpPortalClient != nil {
+		rpc.GlobalPumpPortalClient.Close()
+	}
+	if rpc.GlobalWebSocketClient != nil {
+		rpc.GlobalWebSocketClient.Close()
+	}
+	// 等待仍在写入哈希数据的队列处理协程退出
+	service.Wait()
+	// 先写入缓冲中的哈希数据，再关闭Redis连接
+	if storage.GlobalHashWriter != nil {
+		storage.GlobalHashWriter.Close()
+	}
+	if storage.GlobalRedisClient != nil {
+		storage.GlobalRedisClient.Close()
+	}
+	logger.Info("程序已关闭")
+	logger.Close()
 }
 
 func initClient() {
@@ -97,15 +111,6 @@ func initClient() {
 	logger.Info("Helius Enhanced API客户端初始化成功")
 }
 
-func initStartService() {
-	service.StartHeliusService()
-	time.Sleep(5 * time.Second)
-	service.ScanBlockQueue()
-	service.ProcessTransactionQueue()
-	service.StartPumpPortalService()
-	logger.Info("所有服务已启动: 区块队列扫描服务、交易队列处理服务、PumpPortal服务")
-}
-
 func initQueue() {
 	storage.InitQueue()
 }
@@ -1,5 +1,7 @@
 package resp
 
+import "encoding/json"
+
 type BlockResp struct {
 	BlockTime         int            `json:"blockTime"`
 	Blockhash         string         `json:"blockhash"`
@@ -144,3 +146,22 @@ type Transactions struct {
 	Transaction Transaction `json:"transaction"`
 	Version     any         `json:"version"`
 }
+
+// BlockSignaturesResp 是区块响应的精简投影，只解码筛选交易签名所需的字段，
+// 跳过余额、指令等大量 interface{} 字段的反射分配
+type BlockSignaturesResp struct {
+	Transactions []BlockSignaturesTransaction `json:"transactions"`
+}
+type BlockSignaturesTransaction struct {
+	Meta struct {
+		LogMessages []string `json:"logMessages"`
+		Status      struct {
+			Err struct {
+				InstructionError json.RawMessage `json:"InstructionError"`
+			} `json:"Err"`
+		} `json:"status"`
+	} `json:"meta"`
+	Transaction struct {
+		Signatures []string `json:"signatures"`
+	} `json:"transaction"`
+}
@@ -12,6 +12,21 @@ var NeedToParseTransactionType = []TransactionType{
 	TransactionTypeUnlabeled,
 }
 
+// needToParseTransactionTypeSet 由 NeedToParseTransactionType 构建的查找集合，每笔交易只需一次哈希查找
+var needToParseTransactionTypeSet = func() map[TransactionType]struct{} {
+	set := make(map[TransactionType]struct{}, len(NeedToParseTransactionType))
+	for _, t := range NeedToParseTransactionType {
+		set[t] = struct{}{}
+	}
+	return set
+}()
+
+// NeedToParse 判断交易类型是否需要解析入库
+func (t TransactionType) NeedToParse() bool {
+	_, ok := needToParseTransactionTypeSet[t]
+	return ok
+}
+
 // TransactionType 定义了 Helius 解析的交易类型
 type TransactionType string
 
@@ -46,6 +61,17 @@ type ParsedTransaction struct {
 	Events           *Events           `json:"events,omitempty"`
 }
 
+// ParsedTransactionSummary 是解析后交易数据的精简投影
+// 只解码入库所需的字段，跳过转账、账户数据、指令和事件等大字段
+type ParsedTransactionSummary struct {
+	Type             TransactionType   `json:"type"`
+	Source           string            `json:"source"`
+	Signature        string            `json:"signature"`
+	Slot             uint64            `json:"slot"`
+	Timestamp        int64             `json:"timestamp"`
+	TransactionError *TransactionError `json:"transactionError,omitempty"`
+}
+
 // NativeTransfer 表示原生代币(SOL)转账
 type NativeTransfer struct {
 	FromUserAccount string `json:"fromUserAccount"`
@@ -4,10 +4,12 @@ import (
 	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
 	"net/http"
 	"net/url"
+	"sync"
 	"time"
 
 	"github.com/life2you/datas-go/models/req"
@@ -17,41 +19,93 @@ import (
 
 	"github.com/life2you/datas-go/configs"
 	"github.com/life2you/datas-go/logger"
+	"github.com/life2you/datas-go/utils"
 	"go.uber.org/zap"
 )
 
+// 共享 Transport 对每个主机保留的空闲连接数
+// 默认值只有 2，并发解析时多出的连接在请求结束后被关闭，下一批请求需要重新建立连接和 TLS 握手
+const maxIdleConnsPerHost = 32
+
+var (
+	// 按代理地址缓存的共享 Transport
+	sharedTransports   = make(map[string]*http.Transport)
+	sharedTransportsMu sync.Mutex
+)
+
+// sharedTransport 返回指定代理地址对应的共享 Transport
+// 同一代理下的所有 Helius 客户端复用同一个连接池，避免各自建立连接和 TLS 握手
+// 参数:
+//   - proxyURLStr: 代理服务器URL，为空表示不使用代理
+//
+// 返回:
+//   - *http.Transport: 共享的 Transport，代理URL无法解析时返回不使用代理且不缓存的 Transport
+func sharedTransport(proxyURLStr string) *http.Transport {
+	sharedTransportsMu.Lock()
+	defer sharedTransportsMu.Unlock()
+
+	if transport, ok := sharedTransports[proxyURLStr]; ok {
+		return transport
+	}
+
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = maxIdleConnsPerHost
+	if proxyURLStr != "" {
+		proxyURL, err := url.Parse(proxyURLStr)
+		if err != nil {
+			// 不缓存未配置代理的回退 Transport，避免之后同一地址一直绕过代理
+			logger.Error("解析代理URL失败，本次不使用代理", zap.String("proxyURL", proxyURLStr), zap.Error(err))
+			return transport
+		}
+		transport.Proxy = http.ProxyURL(proxyURL)
+	}
+	sharedTransports[proxyURLStr] = transport
+	return transport
+}
+
 // HeliusClient 表示 Helius HTTP API 客户端
 type HeliusApiClient struct {
 	httpClient *http.Client
 	endpoint   string
 	apiKey     string
 	proxyURL   string
+	requestURL string // 预先拼接好的请求URL(含API密钥)
 }
 
 var GlobalHeliusClient *HeliusApiClient
 
+// JSONRPCRequest 表示 JSON-RPC 2.0 请求
+// 使用固定字段的结构体序列化，避免每次请求构造 map 以及按键排序编码
+type JSONRPCRequest struct {
+	JSONRPC string        `json:"jsonrpc"`
+	ID      int           `json:"id"`
+	Method  string        `json:"method"`
+	Params  []interface{} `json:"params"`
+}
+
+// newJSONRPCRequest 创建 JSON-RPC 2.0 请求
+func newJSONRPCRequest(id int, method string, params []interface{}) JSONRPCRequest {
+	return JSONRPCRequest{
+		JSONRPC: "2.0",
+		ID:      id,
+		Method:  method,
+		Params:  params,
+	}
+}
+
 // NewHeliusClientFromConfig 从配置创建一个新的 Helius HTTP API 客户端
 func NewHeliusClient(config *configs.HeliusAPIConfig) *HeliusApiClient {
 	// 使用与 WebSocket 相同的网络类型和 API 密钥
 	baseURL := config.Endpoint
 	apiKey := config.APIKey
 
-	// 创建一个带有超时设置的 HTTP 客户端
+	// 创建一个带有超时设置的 HTTP 客户端，连接池与其他 Helius 客户端共享
 	httpClient := &http.Client{
-		Timeout: 120 * time.Second,
+		Timeout:   120 * time.Second,
+		Transport: sharedTransport(config.ProxyURL),
 	}
-
-	// 如果配置了代理，设置代理
 	if config.ProxyURL != "" {
-		proxyURL, err := url.Parse(config.ProxyURL)
-		if err != nil {
-			logger.Error("解析代理URL失败", zap.Error(err))
-		} else {
-			httpClient.Transport = &http.Transport{
-				Proxy: http.ProxyURL(proxyURL),
-			}
-			logger.Info("Helius HTTP API 客户端将使用代理", zap.String("proxy", config.ProxyURL))
-		}
+		logger.Info("Helius HTTP API 客户端将使用代理", zap.String("proxy", config.ProxyURL))
 	}
 
 	client := &HeliusApiClient{
@@ -59,6 +113,7 @@ func NewHeliusClient(config *configs.HeliusAPIConfig) *HeliusApiClient {
 		endpoint:   baseURL,
 		apiKey:     apiKey,
 		proxyURL:   config.ProxyURL,
+		requestURL: fmt.Sprintf("%s/?api-key=%s", baseURL, apiKey),
 	}
 
 	GlobalHeliusClient = client
@@ -73,31 +128,20 @@ func (c *HeliusApiClient) SetProxyURL(proxyURLStr string) error {
 		return nil
 	}
 
-	proxyURL, err := url.Parse(proxyURLStr)
-	if err != nil {
+	if _, err := url.Parse(proxyURLStr); err != nil {
 		return fmt.Errorf("解析代理URL失败: %w", err)
 	}
 
 	c.proxyURL = proxyURLStr
-	c.httpClient.Transport = &http.Transport{
-		Proxy: http.ProxyURL(proxyURL),
-	}
+	c.httpClient.Transport = sharedTransport(proxyURLStr)
 
 	return nil
 }
 
 // 发送 HTTP 请求到 Helius API
 func (c *HeliusApiClient) makeRequest(ctx context.Context, method string, params []interface{}) (json.RawMessage, error) {
-	// 构建请求 URL（添加 API 密钥）
-	requestURL := fmt.Sprintf("%s/?api-key=%s", c.endpoint, c.apiKey)
-
 	// 构建请求体
-	requestBody := map[string]interface{}{
-		"jsonrpc": "2.0",
-		"id":      1,
-		"method":  method,
-		"params":  params,
-	}
+	requestBody := newJSONRPCRequest(1, method, params)
 
 	// 将请求体序列化为 JSON
 	requestJSON, err := json.Marshal(requestBody)
@@ -106,7 +150,7 @@ func (c *HeliusApiClient) makeRequest(ctx context.Context, method string, params
 	}
 
 	// 创建 HTTP 请求
-	req, err := http.NewRequestWithContext(ctx, "POST", requestURL, bytes.NewBuffer(requestJSON))
+	req, err := http.NewRequestWithContext(ctx, "POST", c.requestURL, bytes.NewBuffer(requestJSON))
 	if err != nil {
 		return nil, fmt.Errorf("创建HTTP请求失败: %w", err)
 	}
@@ -117,17 +161,15 @@ func (c *HeliusApiClient) makeRequest(ctx context.Context, method string, params
 	if err != nil {
 		return nil, fmt.Errorf("发送HTTP请求失败: %w", err)
 	}
-	defer respJson.Body.Close()
-
-	// 读取响应体
-	respBody, err := io.ReadAll(respJson.Body)
-	if err != nil {
-		return nil, fmt.Errorf("读取响应失败: %w", err)
-	}
+	defer func() {
+		// 解码器读到 JSON 结尾就停止，读完剩余内容连接才能放回连接池复用
+		_, _ = io.Copy(io.Discard, respJson.Body)
+		respJson.Body.Close()
+	}()
 
-	// 解析响应
+	// 直接从响应流解析，区块响应可达数MB，避免先完整读入一份再复制出 Result
 	var response resp.HeliusResponse
-	if err := json.Unmarshal(respBody, &response); err != nil {
+	if err := json.NewDecoder(respJson.Body).Decode(&response); err != nil {
 		return nil, fmt.Errorf("解析响应失败: %w", err)
 	}
 
@@ -139,17 +181,24 @@ func (c *HeliusApiClient) makeRequest(ctx context.Context, method string, params
 	return response.Result, nil
 }
 
+// defaultGetBlockParams 是 getBlock 的默认参数，只构造一次，各次请求只读共享
+// 默认不包含奖励信息，减少响应大小；Rewards 为空时服务端会按默认值返回奖励，因此需要显式设为false
+var defaultGetBlockParams = func() *req.GetBlockParams {
+	rewards := false
+	return &req.GetBlockParams{
+		Encoding:                       "json",
+		TransactionDetails:             "full",
+		Rewards:                        &rewards,
+		MaxSupportedTransactionVersion: 0,
+		Commitment:                     "finalized",
+	}
+}()
+
 // GetBlock 获取指定槽位的区块数据
 func (c *HeliusApiClient) GetBlock(ctx context.Context, slot uint64, params *req.GetBlockParams) (json.RawMessage, error) {
 	//如果没有提供参数，使用默认参数
 	if params == nil {
-		// 默认不包含奖励信息，减少响应大小
-		params = &req.GetBlockParams{
-			Encoding:                       "json",
-			TransactionDetails:             "full",
-			MaxSupportedTransactionVersion: 0,
-			Commitment:                     "finalized",
-		}
+		params = defaultGetBlockParams
 	}
 
 	// 构建请求参数
@@ -167,15 +216,52 @@ func (c *HeliusApiClient) GetBlock(ctx context.Context, slot uint64, params *req
 }
 
 type HeliusEnhancedApiClient struct {
-	apiKey     string
-	httpClient *http.Client
-	endpoint   string
-	proxyURL   string
+	apiKey               string
+	httpClient           *http.Client
+	endpoint             string
+	proxyURL             string
+	parseTransactionsURL string // 预先拼接好的交易解析接口URL
+	authorization        string // 预先编码好的 Authorization 头，未设置API密钥时为空
 }
 
 // 全局增强API客户端池
 var GlobalHeliusEnhancedApiClients []*HeliusEnhancedApiClient
 
+// MaxParseTransactionsBatch 单次解析交易请求允许的最大签名数量
+const MaxParseTransactionsBatch = 100
+
+const (
+	// 解析交易请求的最大重试次数
+	maxParseRetries = 3
+	// 解析交易重试的基础等待时间
+	parseRetryBaseDelay = 200 * time.Millisecond
+	// 解析交易重试的最大等待时间
+	parseRetryMaxDelay = 5 * time.Second
+)
+
+// apiStatusError 表示 API 返回了非 200 状态码
+type apiStatusError struct {
+	statusCode int
+	message    string
+}
+
+func (e *apiStatusError) Error() string {
+	return e.message
+}
+
+// isRetryableRequestError 判断请求错误是否值得重试
+// 限流(429)、服务端错误(5xx)和网络错误可重试，上下文结束或其他客户端错误不重试
+func isRetryableRequestError(ctx context.Context, err error) bool {
+	if ctx.Err() != nil {
+		return false
+	}
+	var statusErr *apiStatusError
+	if errors.As(err, &statusErr) {
+		return statusErr.statusCode == http.StatusTooManyRequests || statusErr.statusCode >= http.StatusInternalServerError
+	}
+	return true
+}
+
 // ParseTransactionsRequest 表示解析交易请求的参数
 type ParseTransactionsRequest struct {
 	Transactions []string `json:"transactions"` // 交易签名数组
@@ -188,17 +274,21 @@ type ParseTransactionsResponse struct {
 
 // NewHeliusEnhancedApiClient 创建一个新的Helius Enhanced API客户端池
 func NewHeliusEnhancedApiClient(config *configs.HeliusEnhancedAPIConfig) {
+	// 所有增强API客户端共用同一个 HTTP 客户端和连接池
 	httpClient := &http.Client{
-		Timeout: 120 * time.Second,
+		Timeout:   120 * time.Second,
+		Transport: sharedTransport(config.ProxyURL),
 	}
 	// 处理多个API key
 	if len(config.APIKeys) > 0 {
 		for i, apiKey := range config.APIKeys {
 			client := &HeliusEnhancedApiClient{
-				apiKey:     apiKey,
-				httpClient: httpClient,
-				endpoint:   config.Endpoint,
-				proxyURL:   config.ProxyURL,
+				apiKey:               apiKey,
+				httpClient:           httpClient,
+				endpoint:             config.Endpoint,
+				proxyURL:             config.ProxyURL,
+				parseTransactionsURL: fmt.Sprintf("%s/v0/transactions?api-key=%s", config.Endpoint, apiKey),
+				authorization:        basicAuthorization(apiKey),
 			}
 			GlobalHeliusEnhancedApiClients = append(GlobalHeliusEnhancedApiClients, client)
 			logger.Info("创建Helius增强API客户端", zap.Int("索引", i), zap.String("endpoint", config.Endpoint))
@@ -208,6 +298,15 @@ func NewHeliusEnhancedApiClient(config *configs.HeliusEnhancedAPIConfig) {
 	logger.Info("Helius增强API客户端池初始化完成", zap.Int("客户端数量", len(GlobalHeliusEnhancedApiClients)))
 }
 
+// basicAuthorization 构建 Basic Auth 头 (username:password)
+// 在 Helius API 中，用户名是 API 密钥，密码可以为空
+func basicAuthorization(apiKey string) string {
+	if apiKey == "" {
+		return ""
+	}
+	return "Basic " + base64.StdEncoding.EncodeToString([]byte(apiKey+":"))
+}
+
 // GetClientCount 获取客户端数量
 func GetEnhancedApiClientCount() int {
 	return len(GlobalHeliusEnhancedApiClients)
@@ -231,9 +330,6 @@ func (c *HeliusEnhancedApiClient) ParseTransactions(ctx context.Context, signatu
 		return nil, fmt.Errorf("至少需要提供一个交易签名")
 	}
 
-	// 构建 Enhanced Transactions API 的 URL
-	apiURL := fmt.Sprintf("%s/v0/transactions?api-key=%s", c.endpoint, c.apiKey)
-
 	// 构建请求体
 	requestBody := ParseTransactionsRequest{
 		Transactions: signatures,
@@ -245,13 +341,23 @@ func (c *HeliusEnhancedApiClient) ParseTransactions(ctx context.Context, signatu
 		return nil, fmt.Errorf("序列化请求失败: %w", err)
 	}
 
-	// 使用 Authorization 头发送请求
-	respBody, err := c.makeRequestWithAuth(ctx, "POST", apiURL, requestJSON)
-	if err != nil {
-		return nil, fmt.Errorf("解析交易失败: %w", err)
-	}
+	// 使用 Authorization 头发送请求，可重试的错误按带抖动的指数退避重试，
+	// 避免多个客户端在限流或服务端故障时同步重试
+	for attempt := 0; ; attempt++ {
+		respBody, err := c.makeRequestWithAuth(ctx, "POST", c.parseTransactionsURL, requestJSON)
+		if err == nil {
+			return respBody, nil
+		}
+		if attempt >= maxParseRetries || !isRetryableRequestError(ctx, err) {
+			return nil, fmt.Errorf("解析交易失败: %w", err)
+		}
 
-	return respBody, nil
+		delay := utils.Backoff(attempt, parseRetryBaseDelay, parseRetryMaxDelay)
+		logger.Warn("解析交易请求失败，准备重试", zap.Int("attempt", attempt+1), zap.Duration("delay", delay), zap.Error(err))
+		if err := utils.Sleep(ctx, delay); err != nil {
+			return nil, fmt.Errorf("解析交易失败: %w", err)
+		}
+	}
 }
 
 // 添加 Authorization 支持
@@ -266,11 +372,8 @@ func (c *HeliusEnhancedApiClient) makeRequestWithAuth(ctx context.Context, metho
 	req.Header.Set("Content-Type", "application/json")
 
 	// 如果设置了 API 密钥，添加 Authorization 头
-	if c.apiKey != "" {
-		// 创建 Basic Auth 字符串 (username:password)
-		// 在 Helius API 中，用户名是 API 密钥，密码可以为空
-		auth := base64.StdEncoding.EncodeToString([]byte(c.apiKey + ":"))
-		req.Header.Set("Authorization", "Basic "+auth)
+	if c.authorization != "" {
+		req.Header.Set("Authorization", c.authorization)
 	}
 
 	// 发送请求
@@ -293,9 +396,15 @@ func (c *HeliusEnhancedApiClient) makeRequestWithAuth(ctx context.Context, metho
 			Message string `json:"message"`
 		}
 		if err := json.Unmarshal(respBody, &errorResp); err == nil && errorResp.Message != "" {
-			return nil, fmt.Errorf("API 返回错误: %s (状态码: %d)", errorResp.Message, resp.StatusCode)
+			return nil, &apiStatusError{
+				statusCode: resp.StatusCode,
+				message:    fmt.Sprintf("API 返回错误: %s (状态码: %d)", errorResp.Message, resp.StatusCode),
+			}
+		}
+		return nil, &apiStatusError{
+			statusCode: resp.StatusCode,
+			message:    fmt.Sprintf("API 请求失败，状态码: %d, 响应: %s", resp.StatusCode, string(respBody)),
 		}
-		return nil, fmt.Errorf("API 请求失败，状态码: %d, 响应: %s", resp.StatusCode, string(respBody))
 	}
 
 	return respBody, nil
@@ -3,19 +3,27 @@ package rpc
 import (
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
-	"log"
+	"net"
 	"net/http"
 	"net/url"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"crypto/tls"
 
 	"github.com/gorilla/websocket"
 	"github.com/life2you/datas-go/configs"
+	"github.com/life2you/datas-go/logger"
+	"github.com/life2you/datas-go/utils"
+	"go.uber.org/zap"
 )
 
+// 重连等待时间上限
+const maxWebSocketReconnectDelay = 2 * time.Minute
+
 // WebSocketClient 表示Helius WebSocket客户端
 type WebSocketClient struct {
 	conn              *websocket.Conn
@@ -27,6 +35,7 @@ type WebSocketClient struct {
 	done              chan struct{}
 	reconnect         bool
 	reconnectInterval time.Duration
+	reconnecting      atomic.Bool // 是否已有重连协程在运行
 	onConnect         func()
 	closed            bool
 	mutex             sync.Mutex
@@ -88,8 +97,8 @@ func (c *WebSocketClient) Connect(ctx context.Context) error {
 		return fmt.Errorf("解析WebSocket URL失败: %w", err)
 	}
 
-	// 设置拨号选项
-	dialer := websocket.DefaultDialer
+	// 设置拨号选项，复制默认拨号器以免修改全局配置
+	dialer := *websocket.DefaultDialer
 
 	// 如果配置了代理，设置代理
 	if c.proxyURL != "" {
@@ -97,14 +106,17 @@ func (c *WebSocketClient) Connect(ctx context.Context) error {
 		if err != nil {
 			return fmt.Errorf("解析代理URL失败: %w", err)
 		}
-		dialer = &websocket.Dialer{
+		dialer = websocket.Dialer{
 			Proxy:            http.ProxyURL(proxyURL),
 			HandshakeTimeout: 45 * time.Second,
 			TLSClientConfig:  &tls.Config{InsecureSkipVerify: true}, // 注意：在生产环境中不建议跳过TLS验证
 		}
-		log.Printf("使用代理连接WebSocket: %s", c.proxyURL)
+		logger.Info("使用代理连接WebSocket", zap.String("proxy", c.proxyURL))
 	}
 
+	// 请求 permessage-deflate 压缩，JSON 消息重复度高，压缩后传输量明显减少；服务端不支持时按未压缩连接处理
+	dialer.EnableCompression = true
+
 	// 建立连接
 	conn, _, err := dialer.DialContext(ctx, u.String(), nil)
 	if err != nil {
@@ -148,11 +160,37 @@ func (c *WebSocketClient) Close() error {
 	return nil
 }
 
+// wsResponse WebSocket服务端消息，同时覆盖订阅通知与请求响应
+type wsResponse struct {
+	JSONRPC string          `json:"jsonrpc"`
+	Method  string          `json:"method,omitempty"`
+	Params  *wsNotification `json:"params,omitempty"`
+	Result  json.RawMessage `json:"result,omitempty"`
+	ID      *int            `json:"id"`
+	Error   *struct {
+		Code    int    `json:"code"`
+		Message string `json:"message"`
+	} `json:"error,omitempty"`
+}
+
+// wsNotification 订阅通知的参数
+type wsNotification struct {
+	Subscription int             `json:"subscription"`
+	Result       json.RawMessage `json:"result"`
+}
+
+// isExpectedCloseError 判断读取错误是否由正常关闭引起
+// 服务端正常关闭或本地主动关闭连接不属于异常，只有其他错误才按警告记录
+func isExpectedCloseError(err error) bool {
+	return websocket.IsCloseError(err, websocket.CloseNormalClosure, websocket.CloseGoingAway) ||
+		errors.Is(err, net.ErrClosed)
+}
+
 // 读取消息的循环
 func (c *WebSocketClient) readLoop() {
 	defer func() {
 		if r := recover(); r != nil {
-			log.Printf("WebSocket读取循环发生意外: %v", r)
+			logger.Error("WebSocket读取循环发生意外", zap.Any("panic", r))
 		}
 		c.handleDisconnect()
 	}()
@@ -164,45 +202,36 @@ func (c *WebSocketClient) readLoop() {
 		default:
 			_, message, err := c.conn.ReadMessage()
 			if err != nil {
-				log.Printf("读取WebSocket消息错误: %v", err)
+				if isExpectedCloseError(err) {
+					logger.Info("WebSocket连接已关闭", zap.Error(err))
+				} else {
+					logger.Warn("读取WebSocket消息错误", zap.Error(err))
+				}
 				return
 			}
 
-			// 解析响应
-			var response struct {
-				JSONRPC string          `json:"jsonrpc"`
-				Method  string          `json:"method,omitempty"`
-				Params  json.RawMessage `json:"params,omitempty"`
-				Result  json.RawMessage `json:"result,omitempty"`
-				ID      *int            `json:"id"`
-				Error   *struct {
-					Code    int    `json:"code"`
-					Message string `json:"message"`
-				} `json:"error,omitempty"`
-			}
-
+			// 解析响应，订阅通知的参数在同一次解码中完成，不再对 params 二次解析
+			var response wsResponse
 			if err := json.Unmarshal(message, &response); err != nil {
-				log.Printf("解析WebSocket响应错误: %v", err)
+				logger.Warn("解析WebSocket响应错误", zap.Error(err))
 				continue
 			}
 
 			// 处理订阅通知
 			if response.Method != "" {
-				var notification struct {
-					Subscription int             `json:"subscription"`
-					Result       json.RawMessage `json:"result"`
-				}
-				if err := json.Unmarshal(response.Params, &notification); err != nil {
-					log.Printf("解析订阅通知错误: %v", err)
+				if response.Params == nil {
+					logger.Warn("订阅通知缺少参数", zap.String("method", response.Method))
 					continue
 				}
+				notification := response.Params
 
 				c.subscriptionMutex.Lock()
 				handler, exists := c.subscriptions[response.Method]
 				c.subscriptionMutex.Unlock()
 
 				if exists {
-					go handler(notification.Result)
+					// 订阅处理函数只做解码和入队，直接在读取循环中调用，不再为每条通知启动协程
+					dispatchNotification(response.Method, handler, notification.Result)
 				}
 			} else if response.ID != nil {
 				// 处理订阅响应
@@ -211,19 +240,30 @@ func (c *WebSocketClient) readLoop() {
 					var subscriptionID int
 					if err := json.Unmarshal(response.Result, &subscriptionID); err == nil {
 						// 成功解析到订阅ID
-						log.Printf("已接收订阅确认，ID: %d", subscriptionID)
+						logger.Info("已接收订阅确认", zap.Int("subscriptionID", subscriptionID))
 					}
 				}
 
 				// 处理错误响应
 				if response.Error != nil {
-					log.Printf("WebSocket响应错误: 代码=%d, 消息=%s", response.Error.Code, response.Error.Message)
+					logger.Error("WebSocket响应错误", zap.Int("code", response.Error.Code), zap.String("message", response.Error.Message))
 				}
 			}
 		}
 	}
 }
 
+// dispatchNotification 调用订阅处理函数，处理函数 panic 不影响读取循环
+func dispatchNotification(method string, handler SubscriptionHandler, result json.RawMessage) {
+	defer func() {
+		if r := recover(); r != nil {
+			logger.Error("处理订阅通知发生意外", zap.String("method", method), zap.Any("panic", r))
+		}
+	}()
+
+	handler(result)
+}
+
 // 处理断开连接的逻辑
 func (c *WebSocketClient) handleDisconnect() {
 	c.mutex.Lock()
@@ -240,25 +280,49 @@ func (c *WebSocketClient) handleDisconnect() {
 		c.conn = nil
 	}
 
-	// 尝试重新连接
-	go func() {
-		log.Printf("WebSocket连接已断开，%v后尝试重连...", c.reconnectInterval)
-		time.Sleep(c.reconnectInterval)
+	// 读取循环和心跳可能同时检测到断线，只启动一个重连协程
+	if !c.reconnecting.CompareAndSwap(false, true) {
+		return
+	}
+	go c.reconnectLoop()
+}
+
+// reconnectLoop 按带抖动的指数退避重连，以重连间隔为基础等待时间，持续失败时不会以固定间隔反复请求服务端
+func (c *WebSocketClient) reconnectLoop() {
+	for attempt := 0; ; attempt++ {
+		delay := utils.Backoff(attempt, c.reconnectInterval, maxWebSocketReconnectDelay)
+		logger.Warn("WebSocket连接已断开，准备重连", zap.Int("attempt", attempt+1), zap.Duration("delay", delay))
+		timer := time.NewTimer(delay)
+		select {
+		case <-c.done:
+			timer.Stop()
+			c.reconnecting.Store(false)
+			return
+		case <-timer.C:
+		}
 
 		ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
-		defer cancel()
+		err := c.Connect(ctx)
+		cancel()
+		if err != nil {
+			logger.Error("WebSocket重连失败", zap.Int("attempt", attempt+1), zap.Error(err))
+			continue
+		}
 
-		if err := c.Connect(ctx); err != nil {
-			log.Printf("WebSocket重连失败: %v", err)
-			// 再次触发断开处理，以便继续尝试重连
+		c.reconnecting.Store(false)
+		logger.Info("WebSocket重连成功")
+		// 新连接可能在重连标记清除前就已断开，此时由这里补发一次断线处理
+		c.mutex.Lock()
+		lost := c.conn == nil && !c.closed
+		c.mutex.Unlock()
+		if lost {
 			c.handleDisconnect()
-		} else {
-			log.Println("WebSocket重连成功")
-
-			// 连接成功后重新订阅
-			c.resubscribe()
+			return
 		}
-	}()
+		// 连接成功后重新订阅
+		c.resubscribe()
+		return
+	}
 }
 
 // 重新订阅所有活跃的订阅
@@ -266,7 +330,7 @@ func (c *WebSocketClient) resubscribe() {
 	// 这里应该实现重新订阅的逻辑
 	// 由于每个订阅都需要特定的参数，这里需要根据实际情况来实现
 	// 此处仅为示例，实际项目中可能需要更复杂的实现
-	log.Println("正在重新建立之前的订阅...")
+	logger.Info("正在重新建立之前的订阅")
 }
 
 // 定期发送ping以保持连接活跃
@@ -282,12 +346,12 @@ func (c *WebSocketClient) pingLoop() {
 			c.mutex.Lock()
 			if c.conn != nil {
 				if err := c.conn.WriteMessage(websocket.PingMessage, []byte{}); err != nil {
-					log.Printf("发送ping消息失败: %v", err)
+					logger.Warn("发送ping消息失败", zap.Error(err))
 					c.mutex.Unlock()
 					c.handleDisconnect()
 					return
 				}
-				log.Println("已发送ping")
+				logger.Debug("已发送ping")
 			}
 			c.mutex.Unlock()
 		}
@@ -313,17 +377,7 @@ func (c *WebSocketClient) subscribe(method string, params []interface{}, handler
 	c.mutex.Unlock()
 
 	requestID := c.getNextID()
-	request := struct {
-		JSONRPC string        `json:"jsonrpc"`
-		ID      int           `json:"id"`
-		Method  string        `json:"method"`
-		Params  []interface{} `json:"params"`
-	}{
-		JSONRPC: "2.0",
-		ID:      requestID,
-		Method:  method,
-		Params:  params,
-	}
+	request := newJSONRPCRequest(requestID, method, params)
 
 	// 发送订阅请求
 	c.mutex.Lock()
@@ -352,17 +406,7 @@ func (c *WebSocketClient) unsubscribe(method string, subscriptionName string) er
 	c.mutex.Unlock()
 
 	requestID := c.getNextID()
-	request := struct {
-		JSONRPC string        `json:"jsonrpc"`
-		ID      int           `json:"id"`
-		Method  string        `json:"method"`
-		Params  []interface{} `json:"params"`
-	}{
-		JSONRPC: "2.0",
-		ID:      requestID,
-		Method:  method,
-		Params:  []interface{}{subscriptionName},
-	}
+	request := newJSONRPCRequest(requestID, method, []interface{}{subscriptionName})
 
 	// 发送取消订阅请求
 	c.mutex.Lock()
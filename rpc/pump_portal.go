@@ -4,40 +4,80 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
-	"log"
 	"net/http"
 	"net/url"
+	"runtime"
+	"slices"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/gorilla/websocket"
 	"github.com/life2you/datas-go/configs"
+	"github.com/life2you/datas-go/logger"
+	"github.com/life2you/datas-go/utils"
+	"go.uber.org/zap"
 )
 
 const (
 	// PumpPortalWSURL 是PumpPortal WebSocket API的URL
 	PumpPortalWSURL = "wss://pumpportal.fun/api/data"
+	// 默认重连基础等待时间
+	defaultPumpPortalReconnectDelay = 5 * time.Second
+	// 重连等待时间上限
+	maxPumpPortalReconnectDelay = 2 * time.Minute
+	// 单个订阅请求最多携带的地址数量，避免订阅大量地址时发送超大消息
+	maxSubscriptionKeysPerRequest = 100
+	// 待处理消息队列容量，队列满时读取循环等待，形成背压
+	pumpPortalInboxSize = 1024
 )
 
 // PumpPortalClient 表示PumpPortal WebSocket客户端
 type PumpPortalClient struct {
 	conn            *websocket.Conn
 	url             string
-	handler         MessageHandler
-	handlersMutex   sync.RWMutex
+	handler         MessageHandler       // 消息处理函数，创建后不再变化，读路径无锁
+	inbox           chan json.RawMessage // 待处理消息队列，由固定数量的工作协程消费
 	done            chan struct{}
 	reconnect       bool
-	reconnectMutex  sync.Mutex
-	reconnectTicker *time.Ticker
-	reconnectDelay  time.Duration
+	reconnecting    atomic.Bool   // 是否已有重连协程在运行
+	reconnectDelay  time.Duration // 重连基础等待时间，按失败次数指数增长
+	maxRetryAttempt int           // 连续重连失败达到该次数后按错误级别告警，小于等于0表示不告警
 	closed          bool
 	connMutex       sync.Mutex
 	proxyURL        string
+	watching        atomic.Pointer[watchSnapshot] // 当前订阅状态快照，读取无锁
+	watchMutex      sync.Mutex                    // 串行化订阅状态的更新
 }
 
-// PumpPortalMessage 表示从PumpPortal接收到的消息
-type PumpPortalMessage struct {
-	TxType string `json:"txType"`
+// watchSnapshot 是订阅状态的只读快照
+// 更新时复制一份修改后整体替换(写时复制)，读取方拿到的快照不会再被修改，可安全跨协程使用
+type watchSnapshot struct {
+	newToken      bool
+	migration     bool
+	tokenTrades   bool // 是否以空地址列表订阅了代币交易事件
+	accountTrades bool // 是否以空地址列表订阅了账户交易事件
+	tokens        map[string]struct{}
+	accounts      map[string]struct{}
+}
+
+// clone 复制快照用于修改
+func (w *watchSnapshot) clone() *watchSnapshot {
+	cloned := &watchSnapshot{
+		newToken:      w.newToken,
+		migration:     w.migration,
+		tokenTrades:   w.tokenTrades,
+		accountTrades: w.accountTrades,
+		tokens:        make(map[string]struct{}, len(w.tokens)),
+		accounts:      make(map[string]struct{}, len(w.accounts)),
+	}
+	for token := range w.tokens {
+		cloned.tokens[token] = struct{}{}
+	}
+	for account := range w.accounts {
+		cloned.accounts[account] = struct{}{}
+	}
+	return cloned
 }
 
 // SubscribeRequest 表示订阅请求
@@ -46,6 +86,22 @@ type SubscribeRequest struct {
 	Keys   []string `json:"keys,omitempty"`
 }
 
+// 不带参数的订阅请求内容固定，预先序列化，发送时无需再次编码
+var (
+	subscribeNewTokenPayload   = mustMarshalRequest(SubscribeRequest{Method: "subscribeNewToken"})
+	unsubscribeNewTokenPayload = mustMarshalRequest(SubscribeRequest{Method: "unsubscribeNewToken"})
+	subscribeMigrationPayload  = mustMarshalRequest(SubscribeRequest{Method: "subscribeMigration"})
+)
+
+// mustMarshalRequest 序列化固定的订阅请求，失败时 panic
+func mustMarshalRequest(request SubscribeRequest) []byte {
+	data, err := json.Marshal(request)
+	if err != nil {
+		panic(fmt.Errorf("序列化订阅请求失败: %w", err))
+	}
+	return data
+}
+
 // MessageHandler 是处理消息的函数类型
 type MessageHandler func(message json.RawMessage)
 
@@ -61,22 +117,44 @@ func DefaultPumpPortalOptions() *configs.PumpPortalOptions {
 
 var GlobalPumpPortalClient *PumpPortalClient
 
-// NewPumpPortalClient 创建一个新的PumpPortal客户端
-func NewPumpPortalClient(options *configs.PumpPortalOptions, handler MessageHandler) {
+// NewPumpPortalClient 创建一个新的PumpPortal客户端，同时设置为全局客户端
+// 参数:
+//   - options: 客户端配置，为nil时使用默认配置
+//   - handler: 消息处理函数
+//
+// 返回:
+//   - *PumpPortalClient: PumpPortal客户端
+func NewPumpPortalClient(options *configs.PumpPortalOptions, handler MessageHandler) *PumpPortalClient {
 	if options == nil {
 		options = DefaultPumpPortalOptions()
 	}
 	if handler == nil {
 		panic("handler cannot be nil")
 	}
-	GlobalPumpPortalClient = &PumpPortalClient{
-		url:            PumpPortalWSURL,
-		handler:        handler,
-		done:           make(chan struct{}),
-		reconnect:      true,
-		reconnectDelay: options.ReconnectDelay,
-		proxyURL:       options.ProxyURL,
+	reconnectDelay := options.ReconnectDelay
+	if reconnectDelay <= 0 {
+		reconnectDelay = defaultPumpPortalReconnectDelay
 	}
+	client := &PumpPortalClient{
+		url:             PumpPortalWSURL,
+		handler:         handler,
+		done:            make(chan struct{}),
+		reconnect:       true,
+		reconnectDelay:  reconnectDelay,
+		maxRetryAttempt: options.MaxRetryAttempt,
+		proxyURL:        options.ProxyURL,
+		inbox:           make(chan json.RawMessage, pumpPortalInboxSize),
+	}
+	// 启动固定数量的工作协程处理消息，替代每条消息启动一个协程
+	for range runtime.NumCPU() {
+		go client.consumeLoop()
+	}
+	client.watching.Store(&watchSnapshot{
+		tokens:   make(map[string]struct{}),
+		accounts: make(map[string]struct{}),
+	})
+	GlobalPumpPortalClient = client
+	return client
 }
 
 // Connect 建立WebSocket连接
@@ -99,8 +177,8 @@ func (c *PumpPortalClient) Connect(ctx context.Context) error {
 		return fmt.Errorf("解析WebSocket URL失败: %w", err)
 	}
 
-	// 设置拨号选项
-	dialer := websocket.DefaultDialer
+	// 设置拨号选项，复制默认拨号器以免修改全局配置
+	dialer := *websocket.DefaultDialer
 
 	// 如果配置了代理，设置代理
 	if c.proxyURL != "" {
@@ -108,13 +186,16 @@ func (c *PumpPortalClient) Connect(ctx context.Context) error {
 		if err != nil {
 			return fmt.Errorf("解析代理URL失败: %w", err)
 		}
-		dialer = &websocket.Dialer{
+		dialer = websocket.Dialer{
 			Proxy:            http.ProxyURL(proxyURL),
 			HandshakeTimeout: 45 * time.Second,
 		}
-		log.Printf("使用代理连接PumpPortal WebSocket: %s", c.proxyURL)
+		logger.Info("使用代理连接PumpPortal WebSocket", zap.String("proxy", c.proxyURL))
 	}
 
+	// 请求 permessage-deflate 压缩，JSON 消息重复度高，压缩后传输量明显减少；服务端不支持时按未压缩连接处理
+	dialer.EnableCompression = true
+
 	// 建立连接
 	conn, _, err := dialer.DialContext(ctx, u.String(), nil)
 	if err != nil {
@@ -122,7 +203,7 @@ func (c *PumpPortalClient) Connect(ctx context.Context) error {
 	}
 
 	c.conn = conn
-	log.Printf("成功连接到PumpPortal WebSocket服务器")
+	logger.Info("成功连接到PumpPortal WebSocket服务器")
 
 	// 启动消息接收循环
 	go c.readLoop()
@@ -146,11 +227,6 @@ func (c *PumpPortalClient) Close() error {
 	close(c.done)
 	c.reconnect = false
 
-	// 停止重连计时器
-	if c.reconnectTicker != nil {
-		c.reconnectTicker.Stop()
-	}
-
 	if c.conn != nil {
 		return c.conn.Close()
 	}
@@ -161,7 +237,7 @@ func (c *PumpPortalClient) Close() error {
 func (c *PumpPortalClient) readLoop() {
 	defer func() {
 		if r := recover(); r != nil {
-			log.Printf("PumpPortal WebSocket读取循环发生意外: %v", r)
+			logger.Error("PumpPortal WebSocket读取循环发生意外", zap.Any("panic", r))
 		}
 		c.handleDisconnect()
 	}()
@@ -173,24 +249,47 @@ func (c *PumpPortalClient) readLoop() {
 		default:
 			_, message, err := c.conn.ReadMessage()
 			if err != nil {
-				log.Printf("读取PumpPortal WebSocket消息错误: %v", err)
+				if isExpectedCloseError(err) {
+					logger.Info("PumpPortal WebSocket连接已关闭", zap.Error(err))
+				} else {
+					logger.Warn("读取PumpPortal WebSocket消息错误", zap.Error(err))
+				}
 				return
 			}
 
-			var msg PumpPortalMessage
-			if err := json.Unmarshal(message, &msg); err != nil {
-				log.Printf("解析PumpPortal WebSocket消息错误: %v", err)
-				continue
+			// 消息由处理函数按需解析，读取循环只负责接收并放入队列
+			select {
+			case c.inbox <- message:
+			case <-c.done:
+				return
 			}
+		}
+	}
+}
 
-			// 根据消息类型调用相应的处理函数
-			c.handlersMutex.RLock()
-			go c.handler(message)
-			c.handlersMutex.RUnlock()
+// consumeLoop 从队列中取出消息并调用处理函数
+func (c *PumpPortalClient) consumeLoop() {
+	for {
+		select {
+		case <-c.done:
+			return
+		case message := <-c.inbox:
+			c.handleMessage(message)
 		}
 	}
 }
 
+// handleMessage 调用处理函数处理单条消息，处理函数 panic 不影响工作协程
+func (c *PumpPortalClient) handleMessage(message json.RawMessage) {
+	defer func() {
+		if r := recover(); r != nil {
+			logger.Error("处理PumpPortal消息发生意外", zap.Any("panic", r))
+		}
+	}()
+
+	c.handler(message)
+}
+
 // 处理断开连接的逻辑
 func (c *PumpPortalClient) handleDisconnect() {
 	c.connMutex.Lock()
@@ -208,42 +307,151 @@ func (c *PumpPortalClient) handleDisconnect() {
 	}
 	c.connMutex.Unlock()
 
-	c.reconnectMutex.Lock()
-	defer c.reconnectMutex.Unlock()
-
-	// 如果重连计时器已存在，先停止它
-	if c.reconnectTicker != nil {
-		c.reconnectTicker.Stop()
+	// readLoop 和 pingLoop 都可能触发断线处理，同一时间只允许一个重连协程运行
+	if !c.reconnecting.CompareAndSwap(false, true) {
+		return
 	}
+	go c.reconnectLoop()
+}
 
-	// 启动重连计时器
-	c.reconnectTicker = time.NewTicker(c.reconnectDelay)
-	go func() {
-		for {
-			select {
-			case <-c.done:
-				return
-			case <-c.reconnectTicker.C:
-				ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
-				if err := c.Connect(ctx); err != nil {
-					log.Printf("重连PumpPortal WebSocket失败: %v, 将在%v后重试", err, c.reconnectDelay)
-					cancel()
-					continue
-				}
-				cancel()
-				// 重连成功后重新订阅
-				c.resubscribe()
-				c.reconnectTicker.Stop()
-				return
+// reconnectLoop 按带抖动的指数退避重连，等待时间达到上限后按上限持续重试
+// PumpPortal 是唯一的数据来源，停止重连会让进程继续运行却不再有数据，因此重试次数只用于告警
+func (c *PumpPortalClient) reconnectLoop() {
+	for attempt := 0; ; attempt++ {
+		delay := utils.Backoff(attempt, c.reconnectDelay, maxPumpPortalReconnectDelay)
+		timer := time.NewTimer(delay)
+		select {
+		case <-c.done:
+			timer.Stop()
+			c.reconnecting.Store(false)
+			return
+		case <-timer.C:
+		}
+
+		ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+		err := c.Connect(ctx)
+		cancel()
+		if err != nil {
+			if c.maxRetryAttempt > 0 && attempt+1 >= c.maxRetryAttempt {
+				logger.Error("重连PumpPortal WebSocket连续失败次数已达到告警阈值，继续重试",
+					zap.Int("attempt", attempt+1), zap.Int("maxRetryAttempt", c.maxRetryAttempt), zap.Error(err))
+			} else {
+				logger.Warn("重连PumpPortal WebSocket失败", zap.Int("attempt", attempt+1), zap.Error(err))
 			}
+			continue
 		}
-	}()
+
+		c.reconnecting.Store(false)
+		// 新连接可能在重连标记清除前就已断开，此时由这里补发一次断线处理
+		c.connMutex.Lock()
+		lost := c.conn == nil && !c.closed
+		c.connMutex.Unlock()
+		if lost {
+			c.handleDisconnect()
+			return
+		}
+		// 重连成功后重新订阅
+		c.resubscribe()
+		return
+	}
 }
 
 // 重新订阅之前的所有订阅
+// PumpPortal不保存订阅状态，重连后按本地记录的订阅快照重新发送订阅请求
 func (c *PumpPortalClient) resubscribe() {
-	// 由于PumpPortal不保存订阅状态，需要调用者自行保存订阅状态并重新订阅
-	log.Printf("已重连PumpPortal WebSocket，请重新订阅所需的数据流")
+	snapshot := c.watching.Load()
+
+	if snapshot.newToken {
+		if err := c.sendPayload(subscribeNewTokenPayload); err != nil {
+			logger.Error("重新订阅新代币事件失败", zap.Error(err))
+		}
+	}
+	if snapshot.migration {
+		if err := c.sendPayload(subscribeMigrationPayload); err != nil {
+			logger.Error("重新订阅代币迁移事件失败", zap.Error(err))
+		}
+	}
+	if snapshot.tokenTrades {
+		if err := c.sendRequest(SubscribeRequest{Method: "subscribeTokenTrade"}); err != nil {
+			logger.Error("重新订阅代币交易事件失败", zap.Error(err))
+		}
+	}
+	if snapshot.accountTrades {
+		if err := c.sendRequest(SubscribeRequest{Method: "subscribeAccountTrade"}); err != nil {
+			logger.Error("重新订阅账户交易事件失败", zap.Error(err))
+		}
+	}
+	if err := c.resubscribeKeys("subscribeTokenTrade", snapshot.tokens); err != nil {
+		logger.Error("重新订阅代币交易事件失败", zap.Error(err))
+	}
+	if err := c.resubscribeKeys("subscribeAccountTrade", snapshot.accounts); err != nil {
+		logger.Error("重新订阅账户交易事件失败", zap.Error(err))
+	}
+	logger.Info("已重连PumpPortal WebSocket并恢复订阅", zap.Int("代币数", len(snapshot.tokens)), zap.Int("账户数", len(snapshot.accounts)))
+}
+
+// resubscribeKeys 直接遍历订阅集合分批发送订阅请求，边遍历边发送，不复制完整的地址列表
+func (c *PumpPortalClient) resubscribeKeys(method string, set map[string]struct{}) error {
+	batch := make([]string, 0, min(len(set), maxSubscriptionKeysPerRequest))
+	for key := range set {
+		batch = append(batch, key)
+		if len(batch) == maxSubscriptionKeysPerRequest {
+			if err := c.sendRequest(SubscribeRequest{Method: method, Keys: batch}); err != nil {
+				return err
+			}
+			batch = batch[:0]
+		}
+	}
+	if len(batch) > 0 {
+		return c.sendRequest(SubscribeRequest{Method: method, Keys: batch})
+	}
+	return nil
+}
+
+// sendKeyedRequest 分批发送带地址列表的订阅请求
+// 返回:
+//   - int: 已成功发送的地址数量，出错时之前的批次已生效
+//   - error: 错误信息
+func (c *PumpPortalClient) sendKeyedRequest(method string, keys []string) (int, error) {
+	if len(keys) == 0 {
+		return 0, c.sendRequest(SubscribeRequest{Method: method})
+	}
+
+	sent := 0
+	for batch := range slices.Chunk(keys, maxSubscriptionKeysPerRequest) {
+		if err := c.sendRequest(SubscribeRequest{Method: method, Keys: batch}); err != nil {
+			return sent, err
+		}
+		sent += len(batch)
+	}
+	return sent, nil
+}
+
+// updateWatching 以写时复制的方式更新订阅状态
+func (c *PumpPortalClient) updateWatching(update func(snapshot *watchSnapshot)) {
+	c.watchMutex.Lock()
+	defer c.watchMutex.Unlock()
+
+	snapshot := c.watching.Load().clone()
+	update(snapshot)
+	c.watching.Store(snapshot)
+}
+
+// setDifference 返回 keys 中不在 set 里的元素，保持原有顺序并去除重复
+func setDifference(keys []string, set map[string]struct{}) []string {
+	diff := make([]string, 0, len(keys))
+	seen := make(map[string]struct{}, len(keys))
+	for _, key := range keys {
+		if _, ok := set[key]; ok {
+			continue
+		}
+		if _, ok := seen[key]; ok {
+			continue
+		}
+		seen[key] = struct{}{}
+		diff = append(diff, key)
+	}
+	return diff
 }
 
 // pingLoop 维持连接活跃
@@ -262,7 +470,7 @@ func (c *PumpPortalClient) pingLoop() {
 				return
 			}
 			if err := c.conn.WriteControl(websocket.PingMessage, []byte{}, time.Now().Add(10*time.Second)); err != nil {
-				log.Printf("PumpPortal WebSocket发送ping失败: %v", err)
+				logger.Warn("PumpPortal WebSocket发送ping失败", zap.Error(err))
 				c.connMutex.Unlock()
 				c.handleDisconnect()
 				return
@@ -274,6 +482,16 @@ func (c *PumpPortalClient) pingLoop() {
 
 // sendRequest 发送请求到WebSocket服务器
 func (c *PumpPortalClient) sendRequest(request interface{}) error {
+	data, err := json.Marshal(request)
+	if err != nil {
+		return fmt.Errorf("序列化请求失败: %w", err)
+	}
+
+	return c.sendPayload(data)
+}
+
+// sendPayload 发送已序列化的请求到WebSocket服务器
+func (c *PumpPortalClient) sendPayload(data []byte) error {
 	c.connMutex.Lock()
 	defer c.connMutex.Unlock()
 
@@ -281,11 +499,6 @@ func (c *PumpPortalClient) sendRequest(request interface{}) error {
 		return fmt.Errorf("WebSocket连接未建立")
 	}
 
-	data, err := json.Marshal(request)
-	if err != nil {
-		return fmt.Errorf("序列化请求失败: %w", err)
-	}
-
 	if err := c.conn.WriteMessage(websocket.TextMessage, data); err != nil {
 		return fmt.Errorf("发送WebSocket消息失败: %w", err)
 	}
@@ -295,67 +508,116 @@ func (c *PumpPortalClient) sendRequest(request interface{}) error {
 
 // SubscribeNewToken 订阅新代币创建事件
 func (c *PumpPortalClient) SubscribeNewToken() error {
-	request := SubscribeRequest{
-		Method: "subscribeNewToken",
-	}
 	// 发送订阅请求
-	return c.sendRequest(request)
+	if err := c.sendPayload(subscribeNewTokenPayload); err != nil {
+		return err
+	}
+	c.updateWatching(func(snapshot *watchSnapshot) { snapshot.newToken = true })
+	return nil
 }
 
 // UnsubscribeNewToken 取消订阅新代币创建事件
 func (c *PumpPortalClient) UnsubscribeNewToken() error {
-	request := SubscribeRequest{
-		Method: "unsubscribeNewToken",
-	}
 	// 发送取消订阅请求
-	return c.sendRequest(request)
+	if err := c.sendPayload(unsubscribeNewTokenPayload); err != nil {
+		return err
+	}
+	c.updateWatching(func(snapshot *watchSnapshot) { snapshot.newToken = false })
+	return nil
 }
 
 // SubscribeTokenTrade 订阅指定代币的交易事件
 func (c *PumpPortalClient) SubscribeTokenTrade(tokenAddresses []string) error {
-	request := SubscribeRequest{
-		Method: "subscribeTokenTrade",
-		Keys:   tokenAddresses,
+	// 只订阅尚未订阅的地址，全部已订阅时不再发送请求
+	if len(tokenAddresses) > 0 {
+		if tokenAddresses = setDifference(tokenAddresses, c.watching.Load().tokens); len(tokenAddresses) == 0 {
+			return nil
+		}
 	}
-	// 发送订阅请求
-	return c.sendRequest(request)
+
+	// 发送订阅请求，已发送的批次即使后续失败也记录到订阅状态
+	sent, err := c.sendKeyedRequest("subscribeTokenTrade", tokenAddresses)
+	if len(tokenAddresses) == 0 && err == nil {
+		// 空地址列表的请求同样需要记录，重连后才能恢复
+		c.updateWatching(func(snapshot *watchSnapshot) { snapshot.tokenTrades = true })
+	}
+	if sent > 0 {
+		c.updateWatching(func(snapshot *watchSnapshot) {
+			for _, tokenAddress := range tokenAddresses[:sent] {
+				snapshot.tokens[tokenAddress] = struct{}{}
+			}
+		})
+	}
+	return err
 }
 
 // UnsubscribeTokenTrade 取消订阅指定代币的交易事件
 func (c *PumpPortalClient) UnsubscribeTokenTrade(tokenAddresses []string) error {
-	request := SubscribeRequest{
-		Method: "unsubscribeTokenTrade",
-		Keys:   tokenAddresses,
+	// 发送取消订阅请求，已发送的批次即使后续失败也记录到订阅状态
+	sent, err := c.sendKeyedRequest("unsubscribeTokenTrade", tokenAddresses)
+	if len(tokenAddresses) == 0 && err == nil {
+		// 空地址列表的请求同样需要记录，重连后才能恢复
+		c.updateWatching(func(snapshot *watchSnapshot) { snapshot.tokenTrades = false })
 	}
-	// 发送取消订阅请求
-	return c.sendRequest(request)
+	if sent > 0 {
+		c.updateWatching(func(snapshot *watchSnapshot) {
+			for _, tokenAddress := range tokenAddresses[:sent] {
+				delete(snapshot.tokens, tokenAddress)
+			}
+		})
+	}
+	return err
 }
 
 // SubscribeAccountTrade 订阅指定账户的交易事件
 func (c *PumpPortalClient) SubscribeAccountTrade(accountAddresses []string) error {
-	request := SubscribeRequest{
-		Method: "subscribeAccountTrade",
-		Keys:   accountAddresses,
+	// 只订阅尚未订阅的地址，全部已订阅时不再发送请求
+	if len(accountAddresses) > 0 {
+		if accountAddresses = setDifference(accountAddresses, c.watching.Load().accounts); len(accountAddresses) == 0 {
+			return nil
+		}
 	}
-	// 发送订阅请求
-	return c.sendRequest(request)
+
+	// 发送订阅请求，已发送的批次即使后续失败也记录到订阅状态
+	sent, err := c.sendKeyedRequest("subscribeAccountTrade", accountAddresses)
+	if len(accountAddresses) == 0 && err == nil {
+		// 空地址列表的请求同样需要记录，重连后才能恢复
+		c.updateWatching(func(snapshot *watchSnapshot) { snapshot.accountTrades = true })
+	}
+	if sent > 0 {
+		c.updateWatching(func(snapshot *watchSnapshot) {
+			for _, accountAddress := range accountAddresses[:sent] {
+				snapshot.accounts[accountAddress] = struct{}{}
+			}
+		})
+	}
+	return err
 }
 
 // UnsubscribeAccountTrade 取消订阅指定账户的交易事件
 func (c *PumpPortalClient) UnsubscribeAccountTrade(accountAddresses []string) error {
-	request := SubscribeRequest{
-		Method: "unsubscribeAccountTrade",
-		Keys:   accountAddresses,
+	// 发送取消订阅请求，已发送的批次即使后续失败也记录到订阅状态
+	sent, err := c.sendKeyedRequest("unsubscribeAccountTrade", accountAddresses)
+	if len(accountAddresses) == 0 && err == nil {
+		// 空地址列表的请求同样需要记录，重连后才能恢复
+		c.updateWatching(func(snapshot *watchSnapshot) { snapshot.accountTrades = false })
 	}
-	// 发送取消订阅请求
-	return c.sendRequest(request)
+	if sent > 0 {
+		c.updateWatching(func(snapshot *watchSnapshot) {
+			for _, accountAddress := range accountAddresses[:sent] {
+				delete(snapshot.accounts, accountAddress)
+			}
+		})
+	}
+	return err
 }
 
 // SubscribeMigration 订阅代币迁移事件
 func (c *PumpPortalClient) SubscribeMigration() error {
-	request := SubscribeRequest{
-		Method: "subscribeMigration",
-	}
 	// 发送订阅请求
-	return c.sendRequest(request)
+	if err := c.sendPayload(subscribeMigrationPayload); err != nil {
+		return err
+	}
+	c.updateWatching(func(snapshot *watchSnapshot) { snapshot.migration = true })
+	return nil
 }
@@ -1,21 +1,34 @@
 package service
 
 import (
+	"context"
 	"time"
 
 	"github.com/life2you/datas-go/handler"
 	"github.com/life2you/datas-go/logger"
 )
 
-func ScanBlockQueue() {
+// 区块扫描间隔
+const scanBlockInterval = 5 * time.Second
+
+// ScanBlockQueue 启动区块队列扫描服务，上下文取消后退出
+func ScanBlockQueue(ctx context.Context) {
+	workers.Add(1)
 	go func() {
+		defer workers.Done()
+		// 使用定时器按固定节奏扫描，扫描耗时不会累加到间隔上；定时器基于单调时钟，不受系统时间调整影响
+		ticker := time.NewTicker(scanBlockInterval)
+		defer ticker.Stop()
 		for {
 			// 处理一个区块
-			handler.StartScanBlockQueue()
+			handler.StartScanBlockQueue(ctx)
 
-			// 添加延迟以避免过快处理
 			logger.Debug("区块扫描完成，等待下一次扫描")
-			time.Sleep(5 * time.Second)
+			select {
+			case <-ctx.Done():
+				return
+			case <-ticker.C:
+			}
 		}
 	}()
 }
@@ -7,23 +7,26 @@ import (
 	"github.com/life2you/datas-go/rpc"
 )
 
-func StartPumpPortalService() {
+// StartPumpPortalService 连接PumpPortal并订阅所需的数据流
+// 参数:
+//   - client: 要使用的PumpPortal客户端
+func StartPumpPortalService(client *rpc.PumpPortalClient) {
 	ctx, cancel := context.WithTimeout(context.Background(), 120*time.Second)
 	defer cancel()
-	rpc.GlobalPumpPortalClient.Connect(ctx)
-	err := rpc.GlobalPumpPortalClient.SubscribeNewToken()
+	client.Connect(ctx)
+	err := client.SubscribeNewToken()
 	if err != nil {
 		panic(err)
 	}
-	err = rpc.GlobalPumpPortalClient.SubscribeAccountTrade(make([]string, 0))
+	err = client.SubscribeAccountTrade(make([]string, 0))
 	if err != nil {
 		panic(err)
 	}
-	err = rpc.GlobalPumpPortalClient.SubscribeMigration()
+	err = client.SubscribeMigration()
 	if err != nil {
 		panic(err)
 	}
-	err = rpc.GlobalPumpPortalClient.SubscribeTokenTrade(make([]string, 0))
+	err = client.SubscribeTokenTrade(make([]string, 0))
 	if err != nil {
 		panic(err)
 	}
@@ -0,0 +1,12 @@
+package service
+
+import "sync"
+
+// workers 记录队列处理协程，关闭时等待它们退出后再释放写入器等资源
+var workers sync.WaitGroup
+
+// Wait 等待所有队列处理协程退出
+// 调用前应先取消传给各服务的上下文
+func Wait() {
+	workers.Wait()
+}
@@ -1,20 +1,24 @@
 package service
 
 import (
+	"context"
+
 	"github.com/life2you/datas-go/handler"
 	"github.com/life2you/datas-go/logger"
 )
 
-// ProcessTransactionQueue 启动队列处理服务
-func ProcessTransactionQueue() {
+// ProcessTransactionQueue 启动队列处理服务，上下文取消后退出
+func ProcessTransactionQueue(ctx context.Context) {
+	workers.Add(1)
 	go func() {
+		defer workers.Done()
 		// 等待系统初始化完成
 
 		logger.Info("启动交易队列处理服务")
 
-		for {
+		for ctx.Err() == nil {
 			// 处理交易队列
-			handler.StartProcessTransactionQueue()
+			handler.StartProcessTransactionQueue(ctx)
 			// 添加处理间隔，防止过度消耗系统资源
 		}
 	}()
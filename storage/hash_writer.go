@@ -0,0 +1,253 @@
+package storage
+
+import (
+	"context"
+	"fmt"
+	"sync"
+	"time"
+
+	"github.com/life2you/datas-go/logger"
+	"github.com/life2you/datas-go/utils"
+	"go.uber.org/zap"
+)
+
+const (
+	// 缓冲区达到该数量时立即写入
+	DefaultHashWriterBatchSize = 500
+	// 缓冲区定时写入间隔
+	DefaultHashWriterInterval = 1 * time.Second
+	// 缓冲区最多保留的批次数，Redis 持续不可用时超出部分丢弃最早的数据
+	hashWriterMaxBufferedBatches = 20
+	// 写入失败后重试的最大等待时间
+	hashWriterRetryMaxDelay = 30 * time.Second
+	// 单次写入的超时时间
+	hashWriterFlushTimeout = 10 * time.Second
+	// 关闭时最后一次写入失败后的重试次数
+	hashWriterCloseRetries = 3
+	// 关闭时重试的基础等待时间
+	hashWriterCloseRetryBaseDelay = 200 * time.Millisecond
+	// 关闭时重试的最大等待时间
+	hashWriterCloseRetryMaxDelay = 2 * time.Second
+)
+
+// 全局哈希批量写入器
+var GlobalHashWriter *HashWriter
+
+// InitHashWriter 使用全局Redis客户端初始化哈希批量写入器
+func InitHashWriter() {
+	GlobalHashWriter = NewHashWriter(GlobalRedisClient, DefaultHashWriterBatchSize, DefaultHashWriterInterval)
+}
+
+// HashWriter 在后台批量写入哈希字段
+// 写入方只把数据追加到缓冲区，由后台协程在缓冲区写满或定时器到期时通过一个管道写入Redis，
+// 既不阻塞写入方，也保证低流量时数据不会在缓冲区中无限期滞留。
+// 写入失败的数据会放回缓冲区，按退避时间在定时器到期时重试；
+// 缓冲区超过上限时丢弃最早的数据，避免 Redis 持续不可用时内存无限增长
+type HashWriter struct {
+	client      *RedisClient
+	batchSize   int
+	maxBuffered int // 缓冲区最多保留的数据条数
+	interval    time.Duration
+
+	mu       sync.Mutex
+	buffer   []HashEntry
+	closed   bool // 关闭后不再接收缓冲写入，Write 改为同步写入
+	retrying bool // 上次写入失败，重试前不再发送写满通知
+
+	flushCh   chan struct{} // 缓冲区写满时通知后台协程
+	done      chan struct{}
+	wg        sync.WaitGroup
+	closeOnce sync.Once
+}
+
+// NewHashWriter 创建哈希批量写入器并启动后台写入协程
+// 参数:
+//   - client: Redis客户端
+//   - batchSize: 缓冲区达到该数量时立即写入
+//   - interval: 定时写入间隔
+//
+// 返回:
+//   - *HashWriter: 哈希批量写入器
+func NewHashWriter(client *RedisClient, batchSize int, interval time.Duration) *HashWriter {
+	if batchSize <= 0 {
+		batchSize = DefaultHashWriterBatchSize
+	}
+	if interval <= 0 {
+		interval = DefaultHashWriterInterval
+	}
+
+	w := &HashWriter{
+		client:      client,
+		batchSize:   batchSize,
+		maxBuffered: batchSize * hashWriterMaxBufferedBatches,
+		interval:    interval,
+		buffer:      make([]HashEntry, 0, batchSize),
+		flushCh:     make(chan struct{}, 1),
+		done:        make(chan struct{}),
+	}
+	w.wg.Add(1)
+	go w.run()
+	return w
+}
+
+// Write 将哈希字段追加到缓冲区，不等待写入Redis
+// 写入器关闭后后台协程不再写入缓冲区，此时改为同步写入并返回写入结果
+// 参数:
+//   - entries: 要写入的哈希字段
+//
+// 返回:
+//   - error: 仅在关闭后同步写入失败时返回错误
+func (w *HashWriter) Write(entries ...HashEntry) error {
+	if len(entries) == 0 {
+		return nil
+	}
+
+	w.mu.Lock()
+	if w.closed {
+		w.mu.Unlock()
+		ctx, cancel := context.WithTimeout(context.Background(), hashWriterFlushTimeout)
+		defer cancel()
+		if err := w.client.StoreHashes(ctx, entries, 0); err != nil {
+			return fmt.Errorf("哈希写入器已关闭，同步写入失败: %w", err)
+		}
+		return nil
+	}
+	w.buffer = append(w.buffer, entries...)
+	dropped := w.trimLocked()
+	full := !w.retrying && len(w.buffer) >= w.batchSize
+	w.mu.Unlock()
+
+	logDropped(dropped)
+	if full {
+		// 已有待处理的通知时无需重复通知
+		select {
+		case w.flushCh <- struct{}{}:
+		default:
+		}
+	}
+	return nil
+}
+
+// Close 停止后台协程并写入缓冲区中剩余的数据
+// 关闭后 Write 仍可调用，会直接同步写入Redis
+func (w *HashWriter) Close() {
+	w.closeOnce.Do(func() {
+		// 先标记关闭，保证最后一次写入之后不会再有数据进入缓冲区
+		w.mu.Lock()
+		w.closed = true
+		w.mu.Unlock()
+
+		close(w.done)
+		w.wg.Wait()
+	})
+}
+
+// run 后台写入循环
+// 写入失败后按退避时间等待，期间忽略定时器和写满通知，避免 Redis 不可用时反复重试
+func (w *HashWriter) run() {
+	defer w.wg.Done()
+
+	ticker := time.NewTicker(w.interval)
+	defer ticker.Stop()
+
+	var (
+		failures int
+		retryAt  time.Time
+	)
+	for {
+		select {
+		case <-w.done:
+			w.flushOnClose()
+			return
+		case <-ticker.C:
+		case <-w.flushCh:
+		}
+
+		if time.Now().Before(retryAt) {
+			continue
+		}
+		if w.flush() {
+			failures = 0
+			continue
+		}
+		retryAt = time.Now().Add(utils.Backoff(failures, w.interval, hashWriterRetryMaxDelay))
+		failures++
+	}
+}
+
+// flushOnClose 关闭时写入缓冲区中剩余的数据，失败时按退避重试
+func (w *HashWriter) flushOnClose() {
+	for attempt := 0; ; attempt++ {
+		if w.flush() {
+			return
+		}
+		if attempt >= hashWriterCloseRetries {
+			break
+		}
+		time.Sleep(utils.Backoff(attempt, hashWriterCloseRetryBaseDelay, hashWriterCloseRetryMaxDelay))
+	}
+
+	w.mu.Lock()
+	lost := len(w.buffer)
+	w.buffer = nil
+	w.mu.Unlock()
+	logger.Error("关闭哈希写入器时多次写入失败，剩余数据未能写入", zap.Int("数量", lost))
+}
+
+// flush 取出缓冲区中的全部数据并批量写入
+// 写入失败时数据放回缓冲区头部，保持先后顺序，等待下一次写入时重试
+// 返回:
+//   - bool: 缓冲区为空或写入成功时返回true
+func (w *HashWriter) flush() bool {
+	// 先交换缓冲区再写入，写入期间不阻塞 Write
+	w.mu.Lock()
+	if len(w.buffer) == 0 {
+		w.mu.Unlock()
+		return true
+	}
+	entries := w.buffer
+	w.buffer = make([]HashEntry, 0, w.batchSize)
+	w.mu.Unlock()
+
+	ctx, cancel := context.WithTimeout(context.Background(), hashWriterFlushTimeout)
+	defer cancel()
+
+	err := w.client.StoreHashes(ctx, entries, 0)
+
+	w.mu.Lock()
+	w.retrying = err != nil
+	var dropped int
+	if err != nil {
+		// HSET 与 EXPIRE 可重复执行，重试不会产生副作用
+		w.buffer = append(entries, w.buffer...)
+		dropped = w.trimLocked()
+	}
+	w.mu.Unlock()
+
+	if err != nil {
+		logger.Error("批量写入哈希失败，数据已放回缓冲区等待重试", zap.Int("数量", len(entries)), zap.Error(err))
+		logDropped(dropped)
+		return false
+	}
+	return true
+}
+
+// trimLocked 缓冲区超过上限时丢弃最早的数据，调用方需持有 mu
+// 返回:
+//   - int: 丢弃的数据条数
+func (w *HashWriter) trimLocked() int {
+	dropped := len(w.buffer) - w.maxBuffered
+	if dropped <= 0 {
+		return 0
+	}
+	clear(w.buffer[:dropped])
+	w.buffer = w.buffer[dropped:]
+	return dropped
+}
+
+// logDropped 记录因缓冲区超过上限而丢弃的数据条数
+func logDropped(dropped int) {
+	if dropped > 0 {
+		logger.Error("哈希写入缓冲区已满，丢弃最早的数据", zap.Int("数量", dropped))
+	}
+}
@@ -70,6 +70,7 @@ type PriorityQueue struct {
 	heap      *priorityQueueImpl // 底层堆实现
 	mu        sync.Mutex         // 用于同步访问堆的互斥锁
 	QueueName string             // 队列名称
+	ready     chan struct{}      // 有新元素入队时发出通知
 }
 
 // NewPriorityQueue 创建一个新的线程安全的优先队列
@@ -79,6 +80,7 @@ func NewPriorityQueue(queueName string) *PriorityQueue {
 	return &PriorityQueue{
 		heap:      pqImpl,
 		QueueName: queueName,
+		ready:     make(chan struct{}, 1),
 	}
 }
 
@@ -93,6 +95,18 @@ func (pq *PriorityQueue) Push(value interface{}, priority int64) {
 	}
 	// heap.Push 会调用 pq.heap 的 Push 方法并调整堆结构
 	heap.Push(pq.heap, item)
+
+	// 已有未处理的通知时无需重复通知
+	select {
+	case pq.ready <- struct{}{}:
+	default:
+	}
+}
+
+// Ready 返回入队通知通道，消费者在队列为空时可等待该通道，而不是休眠轮询。
+// 通知可能早于上一次出队发出，收到通知后队列仍可能为空，消费者应重新出队检查。
+func (pq *PriorityQueue) Ready() <-chan struct{} {
+	return pq.ready
 }
 
 // Pop 移除并返回优先级最高的元素。
@@ -107,10 +121,30 @@ func (pq *PriorityQueue) Pop() (interface{}, int64, bool) {
 
 	// heap.Pop 会调用 pq.heap 的 Pop 方法并调整堆结构
 	item := heap.Pop(pq.heap).(*Item)
-	logger.Infof("队列 %s 移除元素 %d ", pq.QueueName, item.Priority)
+	logger.Debugf("队列 %s 移除元素 %d ", pq.QueueName, item.Priority)
 	return item.Value, item.Priority, true
 }
 
+// PopBatch 在一次加锁内移除并返回最多 n 个优先级最高的元素，按优先级从高到低排列。
+// 如果队列为空，返回空切片。
+func (pq *PriorityQueue) PopBatch(n int) []interface{} {
+	pq.mu.Lock()
+	defer pq.mu.Unlock()
+
+	n = min(n, pq.heap.Len())
+	if n <= 0 {
+		return nil
+	}
+
+	values := make([]interface{}, 0, n)
+	for range n {
+		item := heap.Pop(pq.heap).(*Item)
+		values = append(values, item.Value)
+	}
+	logger.Debugf("队列 %s 批量移除 %d 个元素", pq.QueueName, n)
+	return values
+}
+
 // Peek 查看优先级最高的元素，但不从队列中移除。
 // 如果队列为空，返回 nil, 0, false。
 func (pq *PriorityQueue) Peek() (interface{}, int64, bool) {
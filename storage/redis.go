@@ -5,6 +5,8 @@ import (
 	"encoding/json"
 	"errors"
 	"fmt"
+	"runtime"
+	"strconv"
 	"time"
 
 	"github.com/gagliardetto/solana-go/rpc"
@@ -28,6 +30,10 @@ const (
 	TransactionQueueKeyPrefix = "solana:transaction:queue"
 	// 区块处理记录集合
 	ProcessedBlocksKey = "solana:blocks:processed"
+	// 通用哈希表键名前缀
+	HashKeyPrefix = "solana:hash:"
+	// 清空区块数据时每页处理的区块数量
+	clearBlocksPageSize = 1000
 )
 
 // 定义常见错误
@@ -58,14 +64,21 @@ func (r *RedisClient) GetClient() *redis.Client {
 	return r.client
 }
 
+const (
+	// 未配置连接池大小时每个CPU对应的连接数
+	poolSizePerCPU = 10
+	// 连接池最多占用服务端 maxclients 的比例
+	maxClientsShare = 0.4
+)
+
 // NewRedisClient 创建新的Redis客户端
+// 连接池大小未配置时按CPU数自动计算，并且不超过服务端 maxclients 的一定比例；显式配置时超过该比例只告警
 func NewRedisClient(options *configs.RedisConfig) {
-	client := redis.NewClient(&redis.Options{
-		Addr:     options.Addr,
-		Password: options.Password,
-		DB:       options.DB,
-		PoolSize: options.PoolSize,
-	})
+	poolSize := options.PoolSize
+	if poolSize <= 0 {
+		poolSize = poolSizePerCPU * runtime.GOMAXPROCS(0)
+	}
+	client := redis.NewClient(newRedisOptions(options, poolSize))
 
 	// 测试连接
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
@@ -76,11 +89,53 @@ func NewRedisClient(options *configs.RedisConfig) {
 		panic(fmt.Errorf("%w: %v", ErrRedisConnection, err))
 	}
 
+	// 连接池大小创建后不可修改，自动计算的值超过服务端上限时按上限重建客户端
+	// 显式配置的值以配置为准，超过上限时只告警
+	if limit := serverPoolLimit(ctx, client); limit > 0 && poolSize > limit {
+		if options.PoolSize > 0 {
+			logger.Warn("配置的Redis连接池大小超过服务端 maxclients 的建议比例", zap.Int("连接池大小", poolSize), zap.Int("建议上限", limit))
+		} else {
+			poolSize = limit
+			_ = client.Close()
+			client = redis.NewClient(newRedisOptions(options, poolSize))
+		}
+	}
+	logger.Info("Redis连接池初始化完成", zap.Int("连接池大小", poolSize), zap.Int("最小空闲连接数", options.MinIdleConns))
+
 	GlobalRedisClient = &RedisClient{
 		client: client,
 	}
 }
 
+// newRedisOptions 根据配置构建Redis连接选项
+func newRedisOptions(options *configs.RedisConfig, poolSize int) *redis.Options {
+	return &redis.Options{
+		Addr:         options.Addr,
+		Password:     options.Password,
+		DB:           options.DB,
+		PoolSize:     poolSize,
+		MinIdleConns: min(options.MinIdleConns, poolSize),
+		DialTimeout:  options.Timeout,
+		ReadTimeout:  options.Timeout,
+		WriteTimeout: options.Timeout,
+	}
+}
+
+// serverPoolLimit 根据服务端 maxclients 计算连接池上限
+// 托管Redis可能禁用 CONFIG 命令，获取失败时返回0表示不限制
+func serverPoolLimit(ctx context.Context, client *redis.Client) int {
+	config, err := client.ConfigGet(ctx, "maxclients").Result()
+	if err != nil {
+		logger.Debug("获取Redis maxclients失败，不限制连接池大小", zap.Error(err))
+		return 0
+	}
+	maxClients, err := strconv.Atoi(config["maxclients"])
+	if err != nil || maxClients <= 0 {
+		return 0
+	}
+	return max(1, int(float64(maxClients)*maxClientsShare))
+}
+
 // Close 关闭Redis连接
 func (r *RedisClient) Close() error {
 	return r.client.Close()
@@ -126,7 +181,7 @@ func (r *RedisClient) GetBlockBySlot(ctx context.Context, slot uint64) (*rpc.Get
 
 	// 从Redis获取区块数据
 	blockJSON, err := r.client.Get(ctx, blockKey).Result()
-	if err == redis.Nil {
+	if errors.Is(err, redis.Nil) {
 		return nil, ErrBlockNotFound
 	} else if err != nil {
 		return nil, fmt.Errorf("获取区块数据失败: %w", err)
@@ -149,29 +204,18 @@ func (r *RedisClient) GetBlockBySlot(ctx context.Context, slot uint64) (*rpc.Get
 //   - uint64: 区块高度
 //   - error: 错误信息
 func (r *RedisClient) GetMinBlock(ctx context.Context) (uint64, error) {
-	// 使用ZRANGE获取最小score的元素(即最小区块高度)
-	slots, err := r.client.ZRange(ctx, BlocksZSetKey, 0, 0).Result()
+	// 使用ZPOPMIN直接弹出score最小的元素(即最小区块高度)，一次往返且原子完成查询与移除
+	popped, err := r.client.ZPopMin(ctx, BlocksZSetKey, 1).Result()
 	if err != nil {
 		return 0, fmt.Errorf("获取最小区块高度失败: %w", err)
 	}
 
-	if len(slots) == 0 {
+	if len(popped) == 0 {
 		return 0, ErrNoBlocksAvailable
 	}
 
-	// 解析区块高度
-	var slot uint64
-	if _, err := fmt.Sscanf(slots[0], "%d", &slot); err != nil {
-		return 0, fmt.Errorf("解析区块高度失败: %w", err)
-	}
-
-	// 从有序集合中移除该区块
-	// 使用原始字符串格式的成员进行删除，与添加时的格式保持一致
-	_, err = r.client.ZRem(ctx, BlocksZSetKey, slots[0]).Result()
-	if err != nil {
-		return 0, fmt.Errorf("移除最小区块失败: %w", err)
-	}
-	return slot, nil
+	// score 即区块高度，无需再解析成员字符串
+	return uint64(popped[0].Score), nil
 }
 
 // GetMaxBlock 获取最大高度的区块
@@ -194,8 +238,8 @@ func (r *RedisClient) GetMaxBlock(ctx context.Context) (uint64, *rpc.GetBlockRes
 	}
 
 	// 解析区块高度
-	var slot uint64
-	if _, err := fmt.Sscanf(slots[0], "%d", &slot); err != nil {
+	slot, err := strconv.ParseUint(slots[0], 10, 64)
+	if err != nil {
 		return 0, nil, fmt.Errorf("解析区块高度失败: %w", err)
 	}
 
@@ -247,8 +291,8 @@ func (r *RedisClient) RemoveBlock(ctx context.Context, slot uint64) error {
 //   - error: 错误信息
 func (r *RedisClient) BlockExists(ctx context.Context, slot uint64) (bool, error) {
 	// 检查区块是否存在于有序集合中
-	exists, err := r.client.ZScore(ctx, BlocksZSetKey, fmt.Sprintf("%d", slot)).Result()
-	if err == redis.Nil {
+	exists, err := r.client.ZScore(ctx, BlocksZSetKey, strconv.FormatUint(slot, 10)).Result()
+	if errors.Is(err, redis.Nil) {
 		return false, nil
 	} else if err != nil {
 		return false, fmt.Errorf("检查区块是否存在失败: %w", err)
@@ -291,8 +335,8 @@ func (r *RedisClient) GetBlocksRange(ctx context.Context, start, stop int64) ([]
 	// 解析区块高度
 	slots := make([]uint64, 0, len(slotsStr))
 	for _, slotStr := range slotsStr {
-		var slot uint64
-		if _, err := fmt.Sscanf(slotStr, "%d", &slot); err != nil {
+		slot, err := strconv.ParseUint(slotStr, 10, 64)
+		if err != nil {
 			return nil, fmt.Errorf("解析区块高度失败: %w", err)
 		}
 		slots = append(slots, slot)
@@ -308,41 +352,33 @@ func (r *RedisClient) GetBlocksRange(ctx context.Context, start, stop int64) ([]
 // 返回:
 //   - error: 错误信息
 func (r *RedisClient) ClearBlocks(ctx context.Context) error {
-	// 获取所有区块高度
-	slots, err := r.client.ZRange(ctx, BlocksZSetKey, 0, -1).Result()
-	if err != nil {
-		return fmt.Errorf("获取所有区块高度失败: %w", err)
-	}
-
-	if len(slots) == 0 {
-		return nil // 没有区块数据，直接返回
-	}
-
-	// 构建所有区块详情的键
-	blockKeys := make([]string, 0, len(slots))
-	for _, slot := range slots {
-		blockKey := fmt.Sprintf("%s%s", BlockHashPrefix, slot)
-		blockKeys = append(blockKeys, blockKey)
-	}
+	// 按页取出区块高度并删除，内存占用和单条命令的规模不随区块数量增长
+	for {
+		slots, err := r.client.ZRange(ctx, BlocksZSetKey, 0, clearBlocksPageSize-1).Result()
+		if err != nil {
+			return fmt.Errorf("获取区块高度失败: %w", err)
+		}
 
-	// 使用管道执行多个命令
-	pipe := r.client.Pipeline()
+		if len(slots) == 0 {
+			return nil // 没有剩余区块数据，有序集合已随最后一个成员删除
+		}
 
-	// 1. 删除有序集合
-	pipe.Del(ctx, BlocksZSetKey)
+		// 构建本页区块详情的键和要移除的成员
+		blockKeys := make([]string, len(slots))
+		members := make([]interface{}, len(slots))
+		for i, slot := range slots {
+			blockKeys[i] = BlockHashPrefix + slot
+			members[i] = slot
+		}
 
-	// 2. 删除所有区块详情
-	if len(blockKeys) > 0 {
+		// 使用管道同时删除区块详情和有序集合中的成员
+		pipe := r.client.Pipeline()
 		pipe.Del(ctx, blockKeys...)
+		pipe.ZRem(ctx, BlocksZSetKey, members...)
+		if _, err := pipe.Exec(ctx); err != nil {
+			return fmt.Errorf("清空区块数据失败: %w", err)
+		}
 	}
-
-	// 执行管道命令
-	_, err = pipe.Exec(ctx)
-	if err != nil {
-		return fmt.Errorf("清空区块数据失败: %w", err)
-	}
-
-	return nil
 }
 
 // 存储Hash到redis
@@ -363,7 +399,7 @@ func (r *RedisClient) StoreHash(ctx context.Context, key string, field string, v
 	}
 
 	// 构建Redis键名
-	redisKey := fmt.Sprintf("solana:hash:%s", key)
+	redisKey := HashKeyPrefix + key
 
 	// 使用管道执行多个命令以提高性能
 	pipe := r.client.Pipeline()
@@ -384,6 +420,57 @@ func (r *RedisClient) StoreHash(ctx context.Context, key string, field string, v
 	return nil
 }
 
+// HashEntry 表示一次待写入的哈希字段
+type HashEntry struct {
+	Key   string      // 哈希键名(不含前缀)
+	Field string      // 哈希字段名
+	Value interface{} // 哈希值
+}
+
+// StoreHashes 在一个管道中批量存储哈希值到Redis
+// 参数:
+//   - ctx: 上下文
+//   - entries: 待写入的哈希字段列表
+//   - expiration: 过期时间，如果为0则不设置过期时间
+//
+// 返回:
+//   - error: 错误信息
+func (r *RedisClient) StoreHashes(ctx context.Context, entries []HashEntry, expiration time.Duration) error {
+	if r == nil || r.client == nil {
+		return errors.New("Redis 客户端尚未初始化")
+	}
+	if len(entries) == 0 {
+		return nil
+	}
+
+	// 按键分组，同一个键的字段合并为一条多字段 HSET，保持键首次出现的顺序；
+	// 同一字段出现多次时按写入顺序由后者覆盖
+	keys := make([]string, 0, len(entries))
+	fieldsByKey := make(map[string][]interface{}, len(entries))
+	for _, entry := range entries {
+		fields, ok := fieldsByKey[entry.Key]
+		if !ok {
+			keys = append(keys, entry.Key)
+		}
+		fieldsByKey[entry.Key] = append(fields, entry.Field, entry.Value)
+	}
+
+	// 所有写入合并到一个管道，一次往返完成
+	pipe := r.client.Pipeline()
+	for _, key := range keys {
+		redisKey := HashKeyPrefix + key
+		pipe.HSet(ctx, redisKey, fieldsByKey[key]...)
+		if expiration > 0 {
+			pipe.Expire(ctx, redisKey, expiration)
+		}
+	}
+
+	if _, err := pipe.Exec(ctx); err != nil {
+		return fmt.Errorf("批量存储哈希值失败: %w", err)
+	}
+	return nil
+}
+
 // 交易签名队列相关操作
 
 // TransactionItem 表示交易队列中的项目
@@ -394,8 +481,9 @@ type TransactionItem struct {
 }
 
 // 获取区块对应的队列键名
+// 目前所有区块共用同一个队列
 func getBlockQueueKey(blockSlot uint64) string {
-	return fmt.Sprintf("%s", TransactionQueueKeyPrefix)
+	return TransactionQueueKeyPrefix
 }
 
 // PushTransactionsForBlock 将交易签名存入指定区块的队列
@@ -414,23 +502,11 @@ func (r *RedisClient) PushTransactionsForBlock(ctx context.Context, blockSlot ui
 	// 获取区块对应的队列键名
 	queueKey := getBlockQueueKey(blockSlot)
 
-	// 将区块添加到处理记录
-	_, err := r.client.SAdd(ctx, ProcessedBlocksKey, blockSlot).Result()
-	if err != nil {
-		return fmt.Errorf("添加区块处理记录失败: %w", err)
-	}
-
-	// 当前时间戳
-	now := time.Now().Unix()
-
-	// 使用管道执行多个命令
-	pipe := r.client.Pipeline()
-
 	// 准备交易项目并序列化
 	item := TransactionItem{
 		BlockSlot:  blockSlot,
 		Signatures: signatures,
-		CreateTime: now,
+		CreateTime: time.Now().Unix(),
 	}
 
 	// 序列化为JSON
@@ -438,11 +514,15 @@ func (r *RedisClient) PushTransactionsForBlock(ctx context.Context, blockSlot ui
 	if err != nil {
 		return fmt.Errorf("序列化交易项目失败: %w", err)
 	}
+
+	// 处理记录与入队放在同一个管道中，一次往返完成
+	pipe := r.client.Pipeline()
+	// 将区块添加到处理记录
+	pipe.SAdd(ctx, ProcessedBlocksKey, blockSlot)
 	// 添加到队列
 	pipe.RPush(ctx, queueKey, itemJSON)
 	// 执行管道命令
-	_, err = pipe.Exec(ctx)
-	if err != nil {
+	if _, err := pipe.Exec(ctx); err != nil {
 		return fmt.Errorf("将交易签名推送到队列失败: %w", err)
 	}
 
@@ -459,7 +539,7 @@ func (r *RedisClient) PushTransactionsForBlock(ctx context.Context, blockSlot ui
 func (r *RedisClient) LPopTransactionQueue(ctx context.Context) (*TransactionItem, error) {
 	// 从队列中获取一个元素
 	itemJSON, err := r.client.LPop(ctx, TransactionQueueKeyPrefix).Result()
-	if err == redis.Nil {
+	if errors.Is(err, redis.Nil) {
 		// 队列为空
 		return nil, nil
 	} else if err != nil {
@@ -492,63 +572,19 @@ func (r *RedisClient) GetTransactionsFromBlock(ctx context.Context, blockSlot ui
 	// 获取区块对应的队列键名
 	queueKey := getBlockQueueKey(blockSlot)
 
-	// 检查队列是否存在
-	exists, err := r.client.Exists(ctx, queueKey).Result()
-	if err != nil {
-		return nil, fmt.Errorf("检查队列存在失败: %w", err)
-	}
-
-	if exists == 0 {
-		// 队列不存在
-		return nil, nil
-	}
-
-	// 获取队列长度
-	queueLen, err := r.client.LLen(ctx, queueKey).Result()
-	if err != nil {
-		return nil, fmt.Errorf("获取队列长度失败: %w", err)
-	}
-
-	if queueLen == 0 {
-		// 队列为空
+	// 使用单条 LPOP key count 批量弹出，服务端一次完成，避免逐条命令的分派开销
+	// 队列不存在或为空时返回 redis.Nil，无需事先检查存在性和长度
+	itemJSONs, err := r.client.LPopCount(ctx, queueKey, count).Result()
+	if errors.Is(err, redis.Nil) {
+		// 队列不存在或已经为空
 		return nil, nil
-	}
-
-	// 调整count，不超过队列长度
-	if int64(count) > queueLen {
-		count = int(queueLen)
-	}
-
-	// 使用管道执行多个LPOP命令
-	pipe := r.client.Pipeline()
-	for i := 0; i < count; i++ {
-		pipe.LPop(ctx, queueKey)
-	}
-
-	// 执行管道命令
-	cmds, err := pipe.Exec(ctx)
-	if err != nil {
+	} else if err != nil {
 		return nil, fmt.Errorf("从队列获取交易项目失败: %w", err)
 	}
 
 	// 解析结果
-	items := make([]TransactionItem, 0, count)
-	for _, cmd := range cmds {
-		// 检查命令是否成功
-		if cmd.Err() == redis.Nil {
-			// 队列已经为空，退出循环
-			break
-		} else if cmd.Err() != nil {
-			return items, fmt.Errorf("从队列获取交易项目失败: %w", cmd.Err())
-		}
-
-		// 获取JSON字符串
-		itemJSON, err := cmd.(*redis.StringCmd).Result()
-		if err != nil {
-			logger.Warn("获取交易项目结果失败", zap.Error(err))
-			continue
-		}
-
+	items := make([]TransactionItem, 0, len(itemJSONs))
+	for _, itemJSON := range itemJSONs {
 		// 反序列化
 		var item TransactionItem
 		if err := json.Unmarshal([]byte(itemJSON), &item); err != nil {
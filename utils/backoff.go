@@ -0,0 +1,53 @@
+package utils
+
+import (
+	"context"
+	"math/rand"
+	"time"
+)
+
+// Backoff 计算第attempt次重试前的等待时间(指数退避 + 抖动)
+// 退避上限 d = min(maxDelay, base*2^attempt)，实际等待时间在 [d/2, d) 区间内随机分布，
+// 即最短等待上限的一半，既保证等待时间随失败次数增长，又避免大量调用方同步重试
+// 参数:
+//   - attempt: 已失败次数，从0开始
+//   - base: 基础等待时间
+//   - maxDelay: 最大等待时间
+//
+// 返回:
+//   - time.Duration: 等待时间
+func Backoff(attempt int, base, maxDelay time.Duration) time.Duration {
+	if base <= 0 {
+		return 0
+	}
+
+	delay := maxDelay
+	if attempt < 62 && base<<uint(attempt) > 0 && base<<uint(attempt) < maxDelay {
+		delay = base << uint(attempt)
+	}
+
+	half := delay / 2
+	if half <= 0 {
+		return delay
+	}
+	return half + time.Duration(rand.Int63n(int64(delay-half)))
+}
+
+// Sleep 等待指定时间，上下文结束时提前返回
+// 参数:
+//   - ctx: 上下文
+//   - d: 等待时间
+//
+// 返回:
+//   - error: 上下文结束时返回 ctx.Err()
+func Sleep(ctx context.Context, d time.Duration) error {
+	timer := time.NewTimer(d)
+	defer timer.Stop()
+
+	select {
+	case <-ctx.Done():
+		return ctx.Err()
+	case <-timer.C:
+		return nil
+	}
+}